@@ -0,0 +1 @@
+"""Local HomeSeer simulator and benchmarks for the HomeSeer integration."""
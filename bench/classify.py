@@ -0,0 +1,118 @@
+"""
+Classification benchmark. Loads a synthetic catalog of 10k devices and times classifying every device into a
+Home Assistant platform and indexing it in the registry, as the bridge does at setup, with the interface and
+forced cover filters as frozensets (as the bridge keeps them) and as plain lists for comparison, followed by
+the registry's index lookups. Needs only aiohttp and libhomeseer; run from the repository root with e.g.
+
+    python -m bench.classify --devices 10000
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+from .common import ALLOWED_INTERFACES, get_api_catalog, load_integration_module
+from .simulator import generate_catalog
+
+DEFAULT_DEVICES = 10000
+DEFAULT_FORCED_COVERS = 100
+DEFAULT_ROUNDS = 10
+
+api = load_integration_module("api")
+registry = load_integration_module("registry")
+
+
+def classify_all(devices: list, allowed_interfaces, forced_covers):
+    """Classify and register every device in a fresh registry, like HomeSeerBridge._index_devices."""
+    device_registry = registry.HomeSeerRegistry()
+    for device in devices:
+        iname = registry.get_interface_name(device)
+        platform = registry.classify_device(
+            device, iname, allowed_interfaces, forced_covers
+        )
+        device_registry.add(
+            registry.DeviceRecord(
+                device.ref, platform, iname, device.device_type_string
+            )
+        )
+    return device_registry
+
+
+def best_of(rounds: int, func, *args) -> float:
+    """Return the shortest time in seconds taken by func(*args) over the given number of rounds."""
+    best = None
+    for _ in range(rounds):
+        start = perf_counter()
+        func(*args)
+        elapsed = perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--devices", type=int, default=DEFAULT_DEVICES)
+    parser.add_argument(
+        "--forced-covers",
+        type=int,
+        default=DEFAULT_FORCED_COVERS,
+        help="number of devices forced to be covers",
+    )
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    homeseer = api.HomeSeerAPI("127.0.0.1", None)
+    start = perf_counter()
+    homeseer.load_catalog(
+        get_api_catalog(generate_catalog(args.devices, seed=args.seed))
+    )
+    load_elapsed = perf_counter() - start
+    devices = list(homeseer.devices.values())
+    forced_covers = random.Random(args.seed).sample(
+        [device.ref for device in devices], min(args.forced_covers, len(devices))
+    )
+
+    print(f"devices: {len(devices)}, forced covers: {len(forced_covers)}")
+    print(f"load catalog: {load_elapsed * 1000:.1f} ms")
+    for name, allowed, forced in (
+        ("frozensets", frozenset(ALLOWED_INTERFACES), frozenset(forced_covers)),
+        ("lists", list(ALLOWED_INTERFACES), list(forced_covers)),
+    ):
+        elapsed = best_of(args.rounds, classify_all, devices, allowed, forced)
+        print(
+            f"classify and index ({name}): {elapsed * 1000:.1f} ms, "
+            f"{elapsed / len(devices) * 1e6:.2f} us per device"
+        )
+
+    device_registry = classify_all(
+        devices, frozenset(ALLOWED_INTERFACES), frozenset(forced_covers)
+    )
+    platforms = sorted(
+        {device_registry.get(device.ref).platform for device in devices} - {None}
+    )
+    elapsed = best_of(
+        args.rounds,
+        lambda: [device_registry.refs_for_platform(platform) for platform in platforms],
+    )
+    print(
+        f"refs_for_platform for {len(platforms)} platforms: {elapsed * 1000:.3f} ms ("
+        + ", ".join(
+            f"{platform} {len(device_registry.refs_for_platform(platform))}"
+            for platform in platforms
+        )
+        + ")"
+    )
+    interfaces = device_registry.interface_names()
+    elapsed = best_of(
+        args.rounds,
+        lambda: [device_registry.refs_for_interface(name) for name in interfaces],
+    )
+    print(
+        f"refs_for_interface for {len(interfaces)} interfaces: {elapsed * 1000:.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Command latency benchmark. Sends controldevicebyvalue commands to the simulator with the integration's API client
+and compares a cold session, which opens a new connection for every command, with the bridge's session
+(create_session), whose keep-alive pool is warmed up first. Commands are sent one at a time and in concurrent
+bursts; the number of connections the simulator accepted is reported for each. Needs only aiohttp and
+libhomeseer; run from the repository root with e.g.
+
+    python -m bench.commands --commands 200 --burst 32
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+import aiohttp
+
+from .common import format_ms, load_integration_module, percentile
+from .simulator import HomeSeerSimulator
+
+DEFAULT_DEVICES = 100
+DEFAULT_COMMANDS = 200
+DEFAULT_BURST = 32
+DEFAULT_BURSTS = 10
+SWITCH_DEVICE_TYPE = "Z-Wave Switch Binary"
+ON_VALUE = 255
+OFF_VALUE = 0
+
+api = load_integration_module("api")
+
+
+def create_cold_session() -> aiohttp.ClientSession:
+    """Return a session that closes every connection after its request, so every command connects anew."""
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(force_close=True))
+
+
+async def async_send(homeseer, ref: int, value: int) -> float:
+    """Send a command and return the time in seconds until HomeSeer responded."""
+    start = perf_counter()
+    await homeseer.control_device_by_value(ref, value)
+    return perf_counter() - start
+
+
+async def async_measure(
+    simulator: HomeSeerSimulator, session, ref: int, args: argparse.Namespace
+) -> None:
+    """Send sequential commands and concurrent bursts of commands through the session and print their latency."""
+    homeseer = api.HomeSeerAPI(
+        "127.0.0.1",
+        session,
+        http_port=simulator.http_port,
+        ascii_port=simulator.ascii_port,
+    )
+    # Warm up: the first request opens the first connection of a pooled session.
+    await async_send(homeseer, ref, OFF_VALUE)
+
+    connections = len(simulator.http_connections)
+    latencies = [
+        await async_send(homeseer, ref, ON_VALUE if index % 2 else OFF_VALUE)
+        for index in range(args.commands)
+    ]
+    print(
+        f"  sequential: p50 {format_ms(percentile(latencies, 50))}, "
+        f"p99 {format_ms(percentile(latencies, 99))}, "
+        f"connections opened: {len(simulator.http_connections) - connections}"
+    )
+
+    connections = len(simulator.http_connections)
+    latencies = []
+    start = perf_counter()
+    for burst in range(args.bursts):
+        value = ON_VALUE if burst % 2 else OFF_VALUE
+        latencies.extend(
+            await asyncio.gather(
+                *(async_send(homeseer, ref, value) for _ in range(args.burst))
+            )
+        )
+    elapsed = perf_counter() - start
+    print(
+        f"  bursts of {args.burst}: p50 {format_ms(percentile(latencies, 50))}, "
+        f"p99 {format_ms(percentile(latencies, 99))}, "
+        f"{len(latencies) / elapsed:.0f} commands/s, "
+        f"connections opened: {len(simulator.http_connections) - connections}"
+    )
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    simulator = HomeSeerSimulator(
+        devices=args.devices,
+        events=0,
+        command_delay=args.command_delay / 1000,
+        seed=args.seed,
+    )
+    await simulator.start()
+    ref = next(
+        ref
+        for ref, raw_device in simulator.devices.items()
+        if raw_device["device_type_string"] == SWITCH_DEVICE_TYPE
+    )
+    try:
+        print("cold (new connection per command):")
+        async with create_cold_session() as session:
+            await async_measure(simulator, session, ref, args)
+        print(
+            f"warm (create_session, {args.connection_limit} connections, keep-alive):"
+        )
+        async with api.create_session(args.connection_limit) as session:
+            await async_measure(simulator, session, ref, args)
+    finally:
+        await simulator.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--devices", type=int, default=DEFAULT_DEVICES)
+    parser.add_argument("--commands", type=int, default=DEFAULT_COMMANDS)
+    parser.add_argument(
+        "--burst", type=int, default=DEFAULT_BURST, help="commands per burst"
+    )
+    parser.add_argument("--bursts", type=int, default=DEFAULT_BURSTS)
+    parser.add_argument(
+        "--connection-limit",
+        type=int,
+        default=api.DEFAULT_CONNECTION_LIMIT,
+        help="connections the warm session may open",
+    )
+    parser.add_argument(
+        "--command-delay",
+        type=float,
+        default=0,
+        help="milliseconds the simulator takes to execute a command",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(async_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Helpers shared by the HomeSeer benchmarks.
+Modules of the integration that do not depend on Home Assistant (api, registry, ...) are loaded without importing
+the integration package itself, so those benchmarks only need aiohttp and libhomeseer. Benchmarks that set up the
+config entry run an in-process Home Assistant instance and need homeassistant installed.
+"""
+
+import asyncio
+import importlib
+import os
+import resource
+import socket
+import sys
+import types
+from typing import Optional
+
+from .simulator import Catalog, HomeSeerSimulator
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INTEGRATION_DIR = os.path.join(REPO_DIR, "custom_components", "homeseer")
+
+# Name of the stand-in package used to import standalone modules of the integration.
+STANDALONE_PACKAGE = "homeseer_standalone"
+
+NAME_TEMPLATE = "{{ device.location2 }} {{ device.location }} {{ device.name }}"
+ALLOWED_INTERFACES = ["Z-Wave", "HomeSeer"]
+SETUP_POLL_INTERVAL = 0.01
+
+
+def load_integration_module(name: str) -> types.ModuleType:
+    """Import a module of the integration that does not depend on Home Assistant, e.g. "api" or "registry"."""
+    if STANDALONE_PACKAGE not in sys.modules:
+        package = types.ModuleType(STANDALONE_PACKAGE)
+        package.__path__ = [INTEGRATION_DIR]
+        sys.modules[STANDALONE_PACKAGE] = package
+    return importlib.import_module(f"{STANDALONE_PACKAGE}.{name}")
+
+
+def get_api_catalog(catalog: Catalog) -> dict:
+    """Return a synthetic catalog in the format HomeSeerAPI.load_catalog takes (and the bridge stores as a snapshot)."""
+    api = load_integration_module("api")
+    return {
+        api.CATALOG_DEVICES: list(catalog.devices.values()),
+        api.CATALOG_CONTROLS: {
+            str(ref): control_pairs for ref, control_pairs in catalog.controls.items()
+        },
+        api.CATALOG_EVENTS: catalog.events,
+    }
+
+
+def get_rss() -> int:
+    """Return the resident set size of this process in bytes (the peak RSS where /proc is not available)."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def get_free_port() -> int:
+    """Return a TCP port on the loopback interface that is currently free."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: list, pct: float) -> Optional[float]:
+    """Return the pct-th percentile (nearest rank) of the values, or None if there are none."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def format_ms(seconds: Optional[float]) -> str:
+    """Format a duration in seconds as milliseconds."""
+    if seconds is None:
+        return "-"
+    return f"{seconds * 1000:.2f} ms"
+
+
+def format_mb(size: int) -> str:
+    """Format a size in bytes as megabytes."""
+    return f"{size / 1024 / 1024:.1f} MB"
+
+
+async def async_start_hass(config_dir: str):
+    """Start a bare Home Assistant instance using config_dir, with the http component on a free local port."""
+    from homeassistant import config_entries, core
+    from homeassistant.helpers import area_registry, device_registry, entity_registry
+    from homeassistant.setup import async_setup_component
+
+    # The integration is loaded from this repository rather than from config_dir.
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+
+    hass = core.HomeAssistant()
+    hass.config.config_dir = config_dir
+    hass.config.skip_pip = True
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    await asyncio.gather(
+        area_registry.async_load(hass),
+        device_registry.async_load(hass),
+        entity_registry.async_load(hass),
+    )
+    await async_setup_component(
+        hass,
+        "http",
+        {"http": {"server_host": "127.0.0.1", "server_port": get_free_port()}},
+    )
+    await hass.async_start()
+    return hass
+
+
+async def async_add_entry(
+    hass, simulator: HomeSeerSimulator, options: Optional[dict] = None
+):
+    """Add and set up a HomeSeer config entry for the simulator, returning the entry once all platforms are set up."""
+    from homeassistant import config_entries
+
+    from custom_components.homeseer.const import DOMAIN
+
+    entry = config_entries.ConfigEntry(
+        version=1,
+        domain=DOMAIN,
+        title="HomeSeer Simulator",
+        data={
+            "host": "127.0.0.1",
+            "username": "default",
+            "password": "default",
+            "http_port": simulator.http_port,
+            "ascii_port": simulator.ascii_port,
+            "namespace": DOMAIN,
+            "name_template": NAME_TEMPLATE,
+            "allow_events": True,
+            "allowed_event_groups": [],
+            "forced_covers": [],
+            "allowed_interfaces": ALLOWED_INTERFACES,
+        },
+        source=config_entries.SOURCE_USER,
+        options=options or {},
+        unique_id=DOMAIN,
+    )
+    await hass.config_entries.async_add(entry)
+    # Tasks are no longer tracked once Home Assistant has started, so wait for the entry to log its setup time.
+    bridge = get_bridge(hass, entry)
+    while bridge.setup_time is None:
+        await asyncio.sleep(SETUP_POLL_INTERVAL)
+    return entry
+
+
+def get_bridge(hass, entry):
+    """Return the HomeSeerBridge of a loaded config entry."""
+    from custom_components.homeseer.const import DOMAIN
+
+    return hass.data[DOMAIN][entry.entry_id]
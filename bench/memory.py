@@ -0,0 +1,193 @@
+"""
+Memory benchmark. Sets up a HomeSeer config entry against the simulator in an in-process Home Assistant instance
+for installs of 1k, 5k and 10k devices and reports, with tracemalloc, the bytes allocated per entity by the whole
+entry setup (entities, states, registry entries and the catalog) and by the entity objects alone, re-created with
+each platform's entity factory. Every size is measured twice, each in a fresh interpreter: with the integration
+as it is, and with the __slots__ of its Entity subclasses removed from a copy of it, for comparison. Needs
+homeassistant installed; run from the repository root with e.g.
+
+    python -m bench.memory --devices 1000 5000 10000
+"""
+
+import argparse
+import ast
+import asyncio
+import gc
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+from .common import (
+    INTEGRATION_DIR,
+    REPO_DIR,
+    async_add_entry,
+    async_start_hass,
+    get_bridge,
+)
+from .simulator import HomeSeerSimulator
+
+DEFAULT_DEVICES = [1000, 5000, 10000]
+SLOTTED = "slotted"
+UNSLOTTED = "unslotted"
+# The Entity subclasses declaring __slots__, by module. Their slots are removed for the unslotted variant.
+ENTITY_SLOTS = {
+    "homeseer.py": "HomeSeerEntity",
+    "scene.py": "HomeSeerScene",
+    "sensor.py": "HomeSeerValueSensor",
+}
+
+
+def copy_unslotted_integration(target_dir: str) -> None:
+    """Copy the integration to target_dir/custom_components/homeseer, removing its Entity subclasses' __slots__."""
+    integration_dir = os.path.join(target_dir, "custom_components", "homeseer")
+    shutil.copytree(
+        INTEGRATION_DIR,
+        integration_dir,
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    for filename, class_name in ENTITY_SLOTS.items():
+        path = os.path.join(integration_dir, filename)
+        with open(path) as source_file:
+            source = source_file.read()
+        class_def = next(
+            node
+            for node in ast.parse(source).body
+            if isinstance(node, ast.ClassDef) and node.name == class_name
+        )
+        slots = next(
+            node
+            for node in class_def.body
+            if isinstance(node, ast.Assign)
+            and any(
+                isinstance(target, ast.Name) and target.id == "__slots__"
+                for target in node.targets
+            )
+        )
+        lines = source.splitlines(keepends=True)
+        del lines[slots.lineno - 1 : slots.end_lineno]
+        with open(path, "w") as source_file:
+            source_file.write("".join(lines))
+
+
+def get_traced_memory() -> int:
+    """Return the size of the memory currently traced, after a full garbage collection."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def create_entities(bridge) -> list:
+    """Create a new entity for every device of every device platform, as the bridge does on platform setup."""
+    return [
+        entity_factory(device, bridge)
+        for platform, (_, entity_factory) in bridge._platforms.items()
+        if platform != "scene"
+        for device in bridge.devices_for_platform(platform)
+    ]
+
+
+async def async_measure(devices: int, seed: int) -> dict:
+    """Set up an entry for an install of the given size and return the entity count and the bytes traced."""
+    simulator = HomeSeerSimulator(devices=devices, events=0, seed=seed)
+    await simulator.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        tracemalloc.start()
+        start = get_traced_memory()
+        entry = await async_add_entry(hass, simulator)
+        setup = get_traced_memory() - start
+        entities = len(hass.states.async_entity_ids())
+
+        start = get_traced_memory()
+        created = create_entities(get_bridge(hass, entry))
+        objects = get_traced_memory() - start
+        count = len(created)
+        del created
+        tracemalloc.stop()
+        await hass.async_stop()
+    await simulator.stop()
+
+    from custom_components.homeseer.homeseer import HomeSeerEntity
+
+    return {
+        "slotted": "__slots__" in vars(HomeSeerEntity),
+        "entities": entities,
+        "setup": setup / entities,
+        "objects": objects / count,
+    }
+
+
+def measure_variant(variant: str, devices: int, seed: int) -> dict:
+    """Run the measurement of one variant in a fresh interpreter and return its result."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "bench.memory",
+            "--variant",
+            variant,
+            "--devices",
+            str(devices),
+            "--seed",
+            str(seed),
+        ],
+        cwd=REPO_DIR,
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    ).stdout
+    result = json.loads(output.splitlines()[-1])
+    if result["slotted"] != (variant == SLOTTED):
+        raise RuntimeError(f"The {variant} variant loaded the wrong integration")
+    return result
+
+
+def run_variant(args: argparse.Namespace) -> None:
+    """Measure the given variant for a single install size and print the result as JSON."""
+    with tempfile.TemporaryDirectory() as integration_dir:
+        # The integration is imported from the first custom_components package on sys.path.
+        if REPO_DIR not in sys.path:
+            sys.path.insert(0, REPO_DIR)
+        if args.variant == UNSLOTTED:
+            copy_unslotted_integration(integration_dir)
+            sys.path.insert(0, integration_dir)
+        result = asyncio.run(async_measure(args.devices[0], args.seed))
+    print(json.dumps(result))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--devices", type=int, nargs="+", default=DEFAULT_DEVICES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--variant",
+        choices=[SLOTTED, UNSLOTTED],
+        help="measure only this variant, for a single install size, in this process",
+    )
+    args = parser.parse_args()
+    if args.variant is not None:
+        run_variant(args)
+        return
+
+    for devices in args.devices:
+        unslotted = measure_variant(UNSLOTTED, devices, args.seed)
+        slotted = measure_variant(SLOTTED, devices, args.seed)
+        print(f"devices: {devices}, entities: {slotted['entities']}")
+        for key, name in (
+            ("setup", "entry setup"),
+            ("objects", "entity objects"),
+        ):
+            saved = unslotted[key] - slotted[key]
+            print(
+                f"  {name}: {unslotted[key]:.0f} bytes per entity without slots, "
+                f"{slotted[key]:.0f} with slots, {saved:.0f} saved "
+                f"({saved / unslotted[key] * 100:.1f}%, "
+                f"{saved * slotted['entities'] / 1024 ** 2:.2f} MiB in total)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Reload benchmark. Sets up a HomeSeer config entry against the simulator in an in-process Home Assistant
+instance, reloads it repeatedly and checks that the number of states, entity registry entries, registered devices
+and live bridge, entity and remote objects stay the same, and that traced memory stays flat, across reloads.
+Exits with status 1 if they do not. Needs homeassistant installed; run from the repository root with e.g.
+
+    python -m bench.reload --devices 500 --reloads 100
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+import gc
+import sys
+import tempfile
+from time import monotonic
+import tracemalloc
+
+from homeassistant.helpers import entity_registry
+
+from .common import (
+    SETUP_POLL_INTERVAL,
+    async_add_entry,
+    async_start_hass,
+    get_bridge,
+)
+from .simulator import DEFAULT_EVENTS, HomeSeerSimulator
+
+DEFAULT_DEVICES = 500
+DEFAULT_RELOADS = 100
+# Traced memory may grow by this many bytes per reload: Home Assistant 2021.x keeps the (emptied) entity
+# platform of every platform on unload, which accounts for roughly 16 KiB per reload.
+DEFAULT_TOLERANCE = 32 * 1024
+# Reloads before memory is measured, so that caches filled on the first reloads are not counted as growth.
+WARMUP_RELOADS = 10
+REPORT_INTERVAL = 10
+
+
+def get_counts(hass, entry) -> tuple:
+    """Return the number of states, entity registry entries and registered devices of the entry."""
+    bridge = get_bridge(hass, entry)
+    registry = entity_registry.async_get(hass)
+    return (
+        len(hass.states.async_entity_ids()),
+        len(entity_registry.async_entries_for_config_entry(registry, entry.entry_id)),
+        len(bridge.registry),
+    )
+
+
+def get_live_objects() -> tuple:
+    """Return the number of HomeSeer bridge, entity and remote objects that have not been garbage collected."""
+    from custom_components.homeseer.homeseer import (
+        HomeSeerBridge,
+        HomeSeerEntity,
+        HomeSeerRemote,
+    )
+
+    gc.collect()
+    live = Counter(
+        cls
+        for obj in gc.get_objects()
+        for cls in (HomeSeerBridge, HomeSeerEntity, HomeSeerRemote)
+        if isinstance(obj, cls)
+    )
+    return live[HomeSeerBridge], live[HomeSeerEntity], live[HomeSeerRemote]
+
+
+def get_traced_memory() -> int:
+    """Return the size of the memory currently traced, after a full garbage collection."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+async def async_reload(hass, entry) -> None:
+    """Reload the config entry and wait for all of its platforms to be set up."""
+    await hass.config_entries.async_reload(entry.entry_id)
+    bridge = get_bridge(hass, entry)
+    while bridge.setup_time is None:
+        await asyncio.sleep(SETUP_POLL_INTERVAL)
+
+
+async def async_run(args: argparse.Namespace) -> bool:
+    simulator = HomeSeerSimulator(
+        devices=args.devices, events=args.events, seed=args.seed
+    )
+    await simulator.start()
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        entry = await async_add_entry(hass, simulator)
+        counts = get_counts(hass, entry)
+        live = get_live_objects()
+        print(
+            f"devices: {args.devices}, events: {args.events}, states: {counts[0]}, "
+            f"entity registry entries: {counts[1]}, registered devices: {counts[2]}"
+        )
+        print(f"live bridges, entities and remotes: {live}")
+
+        flat = True
+        baseline = None
+        warmup = min(WARMUP_RELOADS, args.reloads)
+        start = monotonic()
+        for reload in range(1, args.reloads + 1):
+            await async_reload(hass, entry)
+            reload_counts = get_counts(hass, entry)
+            if reload_counts != counts:
+                print(f"reload {reload}: counts changed to {reload_counts}")
+                flat = False
+            if reload == warmup:
+                baseline = get_traced_memory()
+            if reload % REPORT_INTERVAL == 0 or reload == args.reloads:
+                reload_live = get_live_objects()
+                if reload_live != live:
+                    print(
+                        f"reload {reload}: live bridges, entities and remotes changed to {reload_live}"
+                    )
+                    flat = False
+                print(
+                    f"reload {reload}: traced memory {get_traced_memory() / 1024:.0f} KiB, "
+                    f"{(monotonic() - start) / reload * 1000:.0f} ms per reload"
+                )
+
+        growth = (get_traced_memory() - baseline) / max(1, args.reloads - warmup)
+        await hass.async_stop()
+    tracemalloc.stop()
+    await simulator.stop()
+
+    print(
+        f"memory growth after reload {warmup}: {growth / 1024:.1f} KiB per reload "
+        f"(tolerance {args.tolerance / 1024:.0f} KiB)"
+    )
+    if growth > args.tolerance:
+        flat = False
+    print("flat" if flat else "NOT flat")
+    return flat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--devices", type=int, default=DEFAULT_DEVICES)
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+    parser.add_argument("--reloads", type=int, default=DEFAULT_RELOADS)
+    parser.add_argument(
+        "--tolerance",
+        type=int,
+        default=DEFAULT_TOLERANCE,
+        help="bytes traced memory may grow by per reload",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    if not asyncio.run(async_run(parser.parse_args())):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
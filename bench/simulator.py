@@ -0,0 +1,439 @@
+"""
+Local stand-in for a HomeSeer server, used to benchmark the HomeSeer integration without HomeSeer or Z-Wave hardware.
+Serves a synthetic device, control pair and event catalog over the JSON API and streams ASCII "DC" device change
+lines at a configurable rate. Commands sent with controldevicebyvalue change the device and are echoed on the ASCII
+connection like HomeSeer does. Only aiohttp is required; run it standalone with e.g.
+
+    python -m bench.simulator --devices 1000 --rate 50 --http-port 8080 --ascii-port 11000
+
+and point a HomeSeer config entry at it (any username and password are accepted).
+"""
+
+import argparse
+import asyncio
+from collections import Counter, namedtuple
+import logging
+import random
+from time import monotonic, time
+from typing import Optional
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_HTTP_PORT = 8080
+DEFAULT_ASCII_PORT = 11000
+DEFAULT_DEVICES = 1000
+DEFAULT_EVENTS = 20
+EVENTS_PER_GROUP = 10
+STREAM_TICK = 0.01
+
+INTERFACE_ZWAVE = "Z-Wave"
+
+# Control pairs as returned by HomeSeer's getcontrol request (ControlUse 1 = On, 2 = Off, 3 = Dim, 18/19 = Lock/Unlock).
+ON_OFF = [
+    {"ControlUse": 1, "ControlValue": 255, "Label": "On"},
+    {"ControlUse": 2, "ControlValue": 0, "Label": "Off"},
+]
+ON_OFF_DIM = ON_OFF + [{"ControlUse": 3, "ControlValue": 0, "Label": "Dim"}]
+LOCK_UNLOCK = [
+    {"ControlUse": 18, "ControlValue": 255, "Label": "Lock"},
+    {"ControlUse": 19, "ControlValue": 0, "Label": "Unlock"},
+]
+
+# A kind of synthetic device: its type string, interface, control pairs, the unit appended to its status
+# (None for devices whose status is a label), the range and precision of its values, its share of the
+# catalog and whether it reports changes on its own (sensors and remotes) or only when controlled.
+DeviceKind = namedtuple(
+    "DeviceKind",
+    (
+        "device_type_string",
+        "interface_name",
+        "control_pairs",
+        "unit",
+        "low",
+        "high",
+        "decimals",
+        "weight",
+        "streams",
+    ),
+)
+
+# Covers the device type strings in homeseer_quirks.py (barrier operator, central scene, binary sensor),
+# every libhomeseer device class and the sensor types the integration handles specially.
+# fmt: off
+DEVICE_KINDS = (
+    DeviceKind("Z-Wave Switch Binary", INTERFACE_ZWAVE, ON_OFF, None, 0, 255, 0, 10, False),
+    DeviceKind("Z-Wave Switch Multilevel", INTERFACE_ZWAVE, ON_OFF_DIM, None, 0, 99, 0, 10, False),
+    DeviceKind("Z-Wave Door Lock", INTERFACE_ZWAVE, LOCK_UNLOCK, None, 0, 255, 0, 3, False),
+    DeviceKind("Z-Wave Barrier Operator", INTERFACE_ZWAVE, ON_OFF, None, 0, 255, 0, 2, False),
+    DeviceKind("Z-Wave Central Scene", INTERFACE_ZWAVE, [], None, 1000, 5004, 0, 3, True),
+    DeviceKind("Z-Wave Sensor Binary", INTERFACE_ZWAVE, [], None, 0, 255, 0, 10, True),
+    DeviceKind("Z-Wave Temperature", INTERFACE_ZWAVE, [], "F", 60, 80, 1, 10, True),
+    DeviceKind("Z-Wave Electric Meter", INTERFACE_ZWAVE, [], "W", 0, 3000, 2, 15, True),
+    DeviceKind("Z-Wave Relative Humidity", INTERFACE_ZWAVE, [], "%", 20, 80, 0, 8, True),
+    DeviceKind("Z-Wave Battery", INTERFACE_ZWAVE, [], "%", 0, 100, 0, 8, True),
+    DeviceKind("Z-Wave Luminance", INTERFACE_ZWAVE, [], "Lux", 0, 1000, 0, 6, True),
+    DeviceKind("Z-Wave Sensor Multilevel", INTERFACE_ZWAVE, [], "V", 110, 125, 1, 5, True),
+    # Virtual devices have no type string or interface.
+    DeviceKind("", "", ON_OFF, None, 0, 255, 0, 10, False),
+)
+# fmt: on
+
+# A synthetic catalog in the JSON API's format: devices maps refs to raw device data, controls maps refs
+# to control pairs, events is a list of raw events and kinds maps refs to the DeviceKind of each device.
+Catalog = namedtuple("Catalog", ("devices", "controls", "events", "kinds"))
+
+LABELS = {
+    "Z-Wave Door Lock": {0: "Unlocked", 255: "Locked"},
+    "Z-Wave Barrier Operator": {0: "Closed", 255: "Open"},
+    "Z-Wave Sensor Binary": {0: "Closed", 255: "Open"},
+}
+
+
+def generate_catalog(devices: int, events: int = 0, seed: int = 0) -> Catalog:
+    """Return the catalog of a synthetic HomeSeer install with the given numbers of devices and events."""
+    rng = random.Random(seed)
+    kinds = rng.choices(
+        DEVICE_KINDS, weights=[kind.weight for kind in DEVICE_KINDS], k=devices
+    )
+    raw_devices = {}
+    controls = {}
+    device_kinds = {}
+    for index, kind in enumerate(kinds):
+        ref = index + 1
+        value = _random_value(rng, kind)
+        raw_devices[ref] = {
+            "ref": ref,
+            "name": f"{kind.device_type_string or 'Virtual'} {ref}",
+            "location": f"Room {index % 50}",
+            "location2": f"Floor {index % 3}",
+            "value": value,
+            "status": get_status(kind, value),
+            "device_type_string": kind.device_type_string,
+            "last_change": get_last_change(),
+            "relationship": 3,
+            "associated_devices": [],
+            "interface_name": kind.interface_name,
+        }
+        controls[ref] = kind.control_pairs
+        device_kinds[ref] = kind
+    raw_events = [
+        {"Group": f"Group {index // EVENTS_PER_GROUP}", "Name": f"Event {index}"}
+        for index in range(events)
+    ]
+    return Catalog(raw_devices, controls, raw_events, device_kinds)
+
+
+def get_status(kind: DeviceKind, value) -> str:
+    """Return the status HomeSeer would report for a device of the given kind with the given value."""
+    if kind.unit is not None:
+        return f"{value} {kind.unit}"
+    if kind.device_type_string in LABELS:
+        return LABELS[kind.device_type_string].get(value, str(value))
+    if kind.control_pairs is ON_OFF_DIM and 0 < value < 99:
+        return f"Dim {value}%"
+    if kind.control_pairs:
+        return "Off" if value == 0 else "On"
+    return str(value)
+
+
+def get_last_change() -> str:
+    """Return the current time in HomeSeer's last_change format."""
+    return f"/Date({int(time() * 1000)})/"
+
+
+def _random_value(rng: random.Random, kind: DeviceKind):
+    """Return a random value for a device of the given kind."""
+    if kind.device_type_string == "Z-Wave Central Scene":
+        return rng.randint(1, 5) * 1000 + rng.choice((0, 1, 3, 4))
+    if kind.decimals:
+        return round(rng.uniform(kind.low, kind.high), kind.decimals)
+    if kind.high == 255:
+        return rng.choice((0, 255))
+    return rng.randint(kind.low, kind.high)
+
+
+class HomeSeerSimulator:
+    """
+    Serves a synthetic HomeSeer catalog over the JSON API and streams ASCII device changes.
+    Changes are streamed at rate lines per second, spread over the devices that report changes on their own;
+    the monotonic time each device's latest change line was written is kept in change_times, so that a benchmark
+    in the same process can measure the latency from a change to its handling. A command_delay (in seconds)
+    delays the response and echo of controldevicebyvalue, like a slow Z-Wave node.
+    """
+
+    def __init__(
+        self,
+        devices: int = DEFAULT_DEVICES,
+        events: int = DEFAULT_EVENTS,
+        rate: float = 0,
+        command_delay: float = 0,
+        seed: int = 0,
+        host: str = DEFAULT_HOST,
+        http_port: int = 0,
+        ascii_port: int = 0,
+    ) -> None:
+        catalog = generate_catalog(devices, events, seed)
+        self.devices = catalog.devices
+        self.controls = catalog.controls
+        self.events = catalog.events
+        self._kinds = catalog.kinds
+        self._streaming = [ref for ref, kind in self._kinds.items() if kind.streams]
+        self._rng = random.Random(seed)
+        self.rate = rate
+        self.command_delay = command_delay
+        self._host = host
+        self._http_port = http_port
+        self._ascii_port = ascii_port
+        self._runner = None
+        self._ascii_server = None
+        self._ascii_clients = set()
+        self._stream_task = None
+        self.change_times = {}
+        self.changes_sent = 0
+        self.requests = Counter()
+        self.http_connections = set()
+
+    @property
+    def http_port(self) -> int:
+        return self._http_port
+
+    @property
+    def ascii_port(self) -> int:
+        return self._ascii_port
+
+    @property
+    def ascii_clients(self) -> int:
+        """Return the number of logged in ASCII connections."""
+        return len(self._ascii_clients)
+
+    async def start(self) -> None:
+        """Start the JSON API and ASCII servers (binding free ports if the ports are 0) and the change stream."""
+        app = web.Application()
+        app.router.add_route("*", "/JSON", self._handle_json)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._http_port)
+        await site.start()
+        self._http_port = self._runner.addresses[0][1]
+
+        self._ascii_server = await asyncio.start_server(
+            self._handle_ascii, self._host, self._ascii_port
+        )
+        self._ascii_port = self._ascii_server.sockets[0].getsockname()[1]
+
+        self._stream_task = asyncio.get_running_loop().create_task(self._stream())
+        _LOGGER.info(
+            "HomeSeer simulator serving %s devices and %s events on %s (JSON port %s, ASCII port %s)",
+            len(self.devices),
+            len(self.events),
+            self._host,
+            self._http_port,
+            self._ascii_port,
+        )
+
+    async def stop(self) -> None:
+        """Stop streaming changes and close all connections."""
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            self._stream_task = None
+        self.disconnect_ascii_clients()
+        if self._ascii_server is not None:
+            self._ascii_server.close()
+            await self._ascii_server.wait_closed()
+            self._ascii_server = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def disconnect_ascii_clients(self) -> None:
+        """Drop all ASCII connections, e.g. to simulate a HomeSeer restart."""
+        for writer in self._ascii_clients:
+            writer.close()
+        self._ascii_clients.clear()
+
+    def change_device(self, ref: int, value=None) -> None:
+        """
+        Change a device's value and send the change to all ASCII clients. Without a value the device is
+        changed to a random value other than its current one, so that every streamed change is written.
+        """
+        raw_device = self.devices[ref]
+        kind = self._kinds[ref]
+        old = raw_device["value"]
+        if value is None:
+            value = old
+            while value == old:
+                value = _random_value(self._rng, kind)
+        raw_device["value"] = value
+        raw_device["status"] = get_status(kind, value)
+        raw_device["last_change"] = get_last_change()
+
+        line = f"DC,{ref},{value},{old}\r\n".encode()
+        for writer in self._ascii_clients:
+            writer.write(line)
+        self.change_times[ref] = monotonic()
+        self.changes_sent += 1
+
+    async def _stream(self) -> None:
+        """Send changes of random streaming devices at the configured rate."""
+        start = monotonic()
+        sent = 0
+        while True:
+            await asyncio.sleep(STREAM_TICK)
+            if not self.rate or not self._streaming:
+                start = monotonic()
+                sent = 0
+                continue
+            due = int((monotonic() - start) * self.rate)
+            for _ in range(due - sent):
+                self.change_device(self._rng.choice(self._streaming))
+            sent = due
+
+    async def _handle_ascii(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Log in an ASCII client and answer its pings until it disconnects."""
+        login = await reader.readline()
+        if not login.startswith(b"au,"):
+            writer.write(b"error\r\n")
+            writer.close()
+            return
+        writer.write(b"ok\r\n")
+        await writer.drain()
+        self._ascii_clients.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip() == b"vr":
+                    writer.write(b"HomeSeer Simulator\r\n")
+        except ConnectionError:
+            pass
+        finally:
+            self._ascii_clients.discard(writer)
+            writer.close()
+
+    async def _handle_json(self, request: web.Request) -> web.Response:
+        """Answer a JSON API request."""
+        self.http_connections.add(request.transport.get_extra_info("peername"))
+        if request.method == "POST":
+            body = await request.json()
+            self.requests[body.get("action")] += 1
+            return web.json_response({"Response": "ok"})
+
+        params = request.query
+        request_type = params.get("request")
+        self.requests[request_type] += 1
+        ref = _get_ref(params)
+
+        if request_type == "getstatus":
+            refs = [ref] if ref is not None else list(self.devices)
+            return web.json_response(
+                {
+                    "Name": "HomeSeer Devices",
+                    "Version": "1.0",
+                    "Devices": [
+                        self.devices[ref] for ref in refs if ref in self.devices
+                    ],
+                }
+            )
+
+        if request_type == "getcontrol":
+            refs = [ref] if ref is not None else list(self.devices)
+            return web.json_response(
+                {
+                    "Name": "HomeSeer Devices",
+                    "Version": "1.0",
+                    "Devices": [
+                        {"ref": ref, "ControlPairs": self.controls[ref]}
+                        for ref in refs
+                        if ref in self.controls
+                    ],
+                }
+            )
+
+        if request_type == "getevents":
+            return web.json_response(
+                {"Name": "HomeSeer Events", "Version": "1.0", "Events": self.events}
+            )
+
+        if request_type == "controldevicebyvalue" and ref in self.devices:
+            if self.command_delay:
+                await asyncio.sleep(self.command_delay)
+            self.change_device(ref, _parse_value(params.get("value")))
+            return web.json_response(
+                {
+                    "Name": "HomeSeer Devices",
+                    "Version": "1.0",
+                    "Devices": [self.devices[ref]],
+                }
+            )
+
+        return web.Response(text="error", status=200)
+
+
+def _get_ref(params) -> Optional[int]:
+    """Return the ref parameter of a request, or None if it has none."""
+    try:
+        return int(params["ref"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _parse_value(value: str):
+    """Return a value parameter as an int or float, the way HomeSeer reports it back."""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    simulator = HomeSeerSimulator(
+        devices=args.devices,
+        events=args.events,
+        rate=args.rate,
+        command_delay=args.command_delay / 1000,
+        seed=args.seed,
+        host=args.host,
+        http_port=args.http_port,
+        ascii_port=args.ascii_port,
+    )
+    await simulator.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--devices", type=int, default=DEFAULT_DEVICES)
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+    parser.add_argument(
+        "--rate", type=float, default=0, help="ASCII device changes per second"
+    )
+    parser.add_argument(
+        "--command-delay",
+        type=float,
+        default=0,
+        help="milliseconds before a command is executed and echoed",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--http-port", type=int, default=DEFAULT_HTTP_PORT)
+    parser.add_argument("--ascii-port", type=int, default=DEFAULT_ASCII_PORT)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
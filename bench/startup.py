@@ -0,0 +1,107 @@
+"""
+Startup benchmark. Times the phases of setting up a HomeSeer install of 5k devices against the simulator:
+fetching the catalog over the JSON API, loading it into devices and classifying them into platforms, which only
+need aiohttp and libhomeseer. When homeassistant is installed, it also times the whole config entry setup with
+all platforms, cold (fetching the catalog) and warm (from the stored snapshot, on reload). Run from the
+repository root with e.g.
+
+    python -m bench.startup --devices 5000
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import tempfile
+from time import perf_counter
+
+import aiohttp
+
+from .common import ALLOWED_INTERFACES, format_mb, get_rss, load_integration_module
+from .simulator import DEFAULT_EVENTS, HomeSeerSimulator
+
+DEFAULT_DEVICES = 5000
+
+api = load_integration_module("api")
+registry = load_integration_module("registry")
+
+
+async def async_time_phases(simulator: HomeSeerSimulator) -> None:
+    """Time fetching, loading and classifying the catalog with the integration's API client."""
+    async with aiohttp.ClientSession() as session:
+        homeseer = api.HomeSeerAPI(
+            "127.0.0.1",
+            session,
+            http_port=simulator.http_port,
+            ascii_port=simulator.ascii_port,
+        )
+        start = perf_counter()
+        catalog = await homeseer.fetch_catalog()
+        fetched = perf_counter()
+        homeseer.load_catalog(catalog)
+        loaded = perf_counter()
+        allowed_interfaces = frozenset(ALLOWED_INTERFACES)
+        device_registry = registry.HomeSeerRegistry()
+        for device in homeseer.devices.values():
+            iname = registry.get_interface_name(device)
+            platform = registry.classify_device(
+                device, iname, allowed_interfaces, frozenset()
+            )
+            device_registry.add(
+                registry.DeviceRecord(
+                    device.ref, platform, iname, device.device_type_string
+                )
+            )
+        classified = perf_counter()
+
+    print(f"fetch catalog: {(fetched - start) * 1000:.1f} ms")
+    print(f"load catalog: {(loaded - fetched) * 1000:.1f} ms")
+    print(f"classify and index: {(classified - loaded) * 1000:.1f} ms")
+
+
+async def async_time_entry_setup(simulator: HomeSeerSimulator) -> None:
+    """Time the config entry setup with all platforms, cold and then warm from the stored snapshot."""
+    from .common import async_add_entry, async_start_hass, get_bridge
+    from .reload import async_reload
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        rss_start = get_rss()
+        entry = await async_add_entry(hass, simulator)
+        cold = get_bridge(hass, entry).setup_time
+        rss_setup = get_rss()
+        await async_reload(hass, entry)
+        warm = get_bridge(hass, entry).setup_time
+        entities = len(hass.states.async_entity_ids())
+        await hass.async_stop()
+
+    print(f"entry setup with {entities} entities, cold: {cold:.3f} s")
+    print(f"entry setup with {entities} entities, warm (from snapshot): {warm:.3f} s")
+    print(f"RSS: {format_mb(rss_start)} before setup, {format_mb(rss_setup)} after")
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    simulator = HomeSeerSimulator(
+        devices=args.devices, events=args.events, seed=args.seed
+    )
+    await simulator.start()
+    try:
+        print(f"devices: {args.devices}, events: {args.events}")
+        await async_time_phases(simulator)
+        if importlib.util.find_spec("homeassistant") is None:
+            print("homeassistant is not installed, skipping the config entry setup")
+        else:
+            await async_time_entry_setup(simulator)
+    finally:
+        await simulator.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--devices", type=int, default=DEFAULT_DEVICES)
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(async_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
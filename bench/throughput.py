@@ -0,0 +1,156 @@
+"""
+End-to-end throughput benchmark. Sets up a HomeSeer config entry against the simulator in an in-process
+Home Assistant instance, streams ASCII device changes at a fixed rate and reports the setup time, the state
+writes sustained per second, the latency from the change line and from the entity's update callback to the
+state write, and the RSS of the process. Needs homeassistant installed; run from the repository root with e.g.
+
+    python -m bench.throughput --devices 1000 --rate 200 --duration 10
+"""
+
+import argparse
+import asyncio
+import tempfile
+from time import monotonic
+
+from homeassistant.core import callback
+
+from .common import (
+    async_add_entry,
+    async_start_hass,
+    format_mb,
+    format_ms,
+    get_bridge,
+    get_rss,
+    percentile,
+)
+from .simulator import DEFAULT_DEVICES, DEFAULT_EVENTS, HomeSeerSimulator
+
+DEFAULT_RATE = 200
+DEFAULT_DURATION = 10
+# Seconds allowed after the stream stops for in-flight changes to be written.
+DRAIN_TIME = 1
+
+
+class WriteTracker:
+    """
+    Records the latency of the bridge's state writes, from the simulator sending the change line and from the
+    entity's update callback scheduling the write. Both the scheduler's schedule and flush are wrapped, so that
+    writes which leave the state unchanged (and fire no state_changed event) are measured too; entities deferred
+    by a minimum update interval are not tracked separately, so the benchmark runs without one.
+    """
+
+    def __init__(self, simulator: HomeSeerSimulator, scheduler) -> None:
+        self._simulator = simulator
+        self._scheduler = scheduler
+        self._async_schedule = scheduler.async_schedule
+        self._async_flush = scheduler._async_flush
+        self._scheduled = {}
+        self.change_latency = []
+        self.callback_latency = []
+        self.writes = 0
+        scheduler.async_schedule = self._async_schedule_tracked
+        scheduler._async_flush = self._async_flush_tracked
+
+    def stop(self) -> None:
+        """Stop tracking state writes."""
+        self._scheduler.async_schedule = self._async_schedule
+        self._scheduler._async_flush = self._async_flush
+
+    @callback
+    def _async_schedule_tracked(self, entity) -> None:
+        self._scheduled.setdefault(entity, monotonic())
+        self._async_schedule(entity)
+
+    @callback
+    def _async_flush_tracked(self) -> None:
+        scheduled = self._scheduled
+        self._scheduled = {}
+        self._async_flush()
+        written = monotonic()
+        self.writes += len(scheduled)
+        for entity, scheduled_at in scheduled.items():
+            self.callback_latency.append(written - scheduled_at)
+            changed = self._simulator.change_times.pop(entity.ref, None)
+            if changed is not None:
+                self.change_latency.append(written - changed)
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    simulator = HomeSeerSimulator(
+        devices=args.devices, events=args.events, seed=args.seed
+    )
+    await simulator.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        rss_start = get_rss()
+        start = monotonic()
+        entry = await async_add_entry(hass, simulator)
+        setup_elapsed = monotonic() - start
+        bridge = get_bridge(hass, entry)
+        entities = len(hass.states.async_entity_ids())
+        rss_setup = get_rss()
+
+        tracker = WriteTracker(simulator, bridge.scheduler)
+        simulator.change_times.clear()
+        changes_start = simulator.changes_sent
+        simulator.rate = args.rate
+        await asyncio.sleep(args.duration)
+        simulator.rate = 0
+        changes = simulator.changes_sent - changes_start
+        writes = tracker.writes
+        await asyncio.sleep(DRAIN_TIME)
+        tracker.stop()
+        # Remotes fire events instead of writing state, so their changes are never consumed.
+        unwritten = sum(
+            1
+            for ref in simulator.change_times
+            if bridge.registry.get(ref).platform != "remote"
+        )
+        rss_end = get_rss()
+        await hass.async_stop()
+    await simulator.stop()
+
+    print(f"devices: {args.devices}, events: {args.events}, entities: {entities}")
+    print(f"setup: {setup_elapsed:.3f} s (logged by the entry: {bridge.setup_time} s)")
+    print(
+        f"changes sent: {changes / args.duration:.1f}/s, "
+        f"state writes sustained: {writes / args.duration:.1f}/s, "
+        f"unwritten after {DRAIN_TIME} s: {unwritten}"
+    )
+    for name, latencies in (
+        ("change line to state write", tracker.change_latency),
+        ("update callback to state write", tracker.callback_latency),
+    ):
+        print(
+            f"{name}: p50 {format_ms(percentile(latencies, 50))}, "
+            f"p99 {format_ms(percentile(latencies, 99))}, "
+            f"max {format_ms(max(latencies, default=None))}"
+        )
+    print(
+        f"RSS: {format_mb(rss_start)} before setup, {format_mb(rss_setup)} after setup, "
+        f"{format_mb(rss_end)} after streaming"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--devices", type=int, default=DEFAULT_DEVICES)
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        help="ASCII device changes per second",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=DEFAULT_DURATION,
+        help="seconds to stream changes for",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(async_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,10 @@ For more details please refer to the documentation at https://github.com/marthoc
 """
 
 import asyncio
+from functools import partial
+import json
 import logging
+from time import monotonic
 import voluptuous as vol
 
 import homeassistant.helpers.config_validation as cv
@@ -14,10 +17,22 @@ from homeassistant.const import (
     CONF_USERNAME,
 )
 
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import template
+from homeassistant.helpers.storage import Store
 
 from .const import (
+    ATTR_DEVICES,
+    ATTR_DURATION,
+    ATTR_ELAPSED,
+    ATTR_EVENTS,
+    ATTR_GROUP,
+    ATTR_METRICS,
+    ATTR_NAME,
+    ATTR_PROFILE,
     ATTR_REF,
+    ATTR_RESULTS,
+    ATTR_TOP,
     ATTR_VALUE,
     CONF_ALLOWED_EVENT_GROUPS,
     CONF_ALLOWED_INTERFACES,
@@ -27,30 +42,288 @@ from .const import (
     CONF_HTTP_PORT,
     CONF_NAME_TEMPLATE,
     CONF_NAMESPACE,
+    DEFAULT_PROFILE_DURATION,
+    DEFAULT_PROFILE_TOP,
     DOMAIN,
+    EVENT_CATALOG_SYNCED,
+    EVENT_CONTROL_DEVICES_RESULT,
+    EVENT_METRICS,
+    EVENT_PROFILE,
+    EVENT_RUN_EVENTS_RESULT,
     HOMESEER_PLATFORMS,
+    MAX_CONCURRENT_COMMANDS,
+    STORAGE_VERSION,
 )
-from .homeseer import HomeSeerBridge
+from .export import HomeSeerExportView
+from .homeseer import HomeSeerBridge, get_session_options
 
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_CONTROL_DEVICE_BY_VALUE = "control_device_by_value"
 
-SERVICE_CONTROL_DEVICE_BY_VALUE_SCHEMA = vol.Schema(
+DEVICE_VALUE_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_REF): cv.positive_int,
         vol.Required(ATTR_VALUE): cv.positive_int,
     }
 )
 
+SERVICE_CONTROL_DEVICE_BY_VALUE_SCHEMA = DEVICE_VALUE_SCHEMA.extend(
+    {vol.Optional(CONF_NAMESPACE): cv.string}
+)
+
+SERVICE_CONTROL_DEVICES = "control_devices"
+
+SERVICE_CONTROL_DEVICES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICES): vol.All(cv.ensure_list, [DEVICE_VALUE_SCHEMA]),
+        vol.Optional(CONF_NAMESPACE): cv.string,
+    }
+)
+
+SERVICE_RUN_EVENTS = "run_events"
+
+EVENT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_GROUP): cv.string,
+        vol.Required(ATTR_NAME): cv.string,
+    }
+)
+
+SERVICE_RUN_EVENTS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_EVENTS): vol.All(cv.ensure_list, [EVENT_SCHEMA]),
+            vol.Optional(ATTR_GROUP): cv.string,
+            vol.Optional(CONF_NAMESPACE): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_EVENTS, ATTR_GROUP),
+)
+
+SERVICE_DUMP_METRICS = "dump_metrics"
+
+SERVICE_DUMP_METRICS_SCHEMA = vol.Schema({vol.Optional(CONF_NAMESPACE): cv.string})
+
+SERVICE_PROFILE_DEVICES = "profile_devices"
+
+SERVICE_PROFILE_DEVICES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=3600)
+        ),
+        vol.Optional(ATTR_TOP, default=DEFAULT_PROFILE_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_NAMESPACE): cv.string,
+    }
+)
+
+SERVICE_SYNC_CATALOG = "sync_catalog"
+
+SERVICE_SYNC_CATALOG_SCHEMA = vol.Schema({vol.Optional(CONF_NAMESPACE): cv.string})
+
 
 async def async_setup(hass, config):
-    """HomeSeer is configured via config entry."""
+    """HomeSeer is configured via config entry; services are shared by all config entries."""
+    hass.data.setdefault(DOMAIN, {})
+    hass.http.register_view(HomeSeerExportView(get_bridge))
+
+    async def control_device_by_value(call):
+        bridge = get_bridge(hass, call.data.get(CONF_NAMESPACE))
+        ref = call.data[ATTR_REF]
+        value = call.data[ATTR_VALUE]
+
+        await bridge.commands.async_send(
+            ref, partial(bridge.api.control_device_by_value, ref, value)
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CONTROL_DEVICE_BY_VALUE,
+        control_device_by_value,
+        schema=SERVICE_CONTROL_DEVICE_BY_VALUE_SCHEMA,
+    )
+
+    async def control_devices(call):
+        bridge = get_bridge(hass, call.data.get(CONF_NAMESPACE))
+        # Collapse duplicate refs to the last value given for each ref.
+        values = {
+            device[ATTR_REF]: device[ATTR_VALUE] for device in call.data[ATTR_DEVICES]
+        }
+
+        start = monotonic()
+        # Commands go through the bridge's command queue, so they stay in order with other commands for the same refs.
+        results = await bridge.api.control_devices_by_value(
+            values, MAX_CONCURRENT_COMMANDS, bridge.commands.async_send
+        )
+        elapsed = round(monotonic() - start, 3)
+
+        _LOGGER.debug(
+            "Controlled %s HomeSeer devices in %s seconds: %s",
+            len(values),
+            elapsed,
+            results,
+        )
+        hass.bus.async_fire(
+            EVENT_CONTROL_DEVICES_RESULT,
+            {
+                CONF_NAMESPACE: bridge.namespace,
+                ATTR_RESULTS: results,
+                ATTR_ELAPSED: elapsed,
+            },
+            context=call.context,
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CONTROL_DEVICES,
+        control_devices,
+        schema=SERVICE_CONTROL_DEVICES_SCHEMA,
+    )
+
+    async def run_events(call):
+        bridge = get_bridge(hass, call.data.get(CONF_NAMESPACE))
+        # Collapse events given more than once (or also included in the group) to a single run.
+        events = list(
+            {
+                (event.group, event.name): event
+                for event in bridge.get_events(
+                    call.data.get(ATTR_EVENTS, []), call.data.get(ATTR_GROUP)
+                )
+            }.values()
+        )
+
+        start = monotonic()
+        results = await bridge.api.run_events(events, MAX_CONCURRENT_COMMANDS)
+        elapsed = round(monotonic() - start, 3)
+
+        _LOGGER.debug(
+            "Ran %s HomeSeer events in %s seconds: %s", len(events), elapsed, results
+        )
+        hass.bus.async_fire(
+            EVENT_RUN_EVENTS_RESULT,
+            {
+                CONF_NAMESPACE: bridge.namespace,
+                ATTR_RESULTS: results,
+                ATTR_ELAPSED: elapsed,
+            },
+            context=call.context,
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RUN_EVENTS,
+        run_events,
+        schema=SERVICE_RUN_EVENTS_SCHEMA,
+    )
+
+    async def dump_metrics(call):
+        bridge = get_bridge(hass, call.data.get(CONF_NAMESPACE))
+        metrics = bridge.get_metrics()
+
+        _LOGGER.info(
+            "HomeSeer metrics for %s: %s", bridge.namespace, json.dumps(metrics)
+        )
+        hass.bus.async_fire(
+            EVENT_METRICS,
+            {CONF_NAMESPACE: bridge.namespace, ATTR_METRICS: metrics},
+            context=call.context,
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DUMP_METRICS,
+        dump_metrics,
+        schema=SERVICE_DUMP_METRICS_SCHEMA,
+    )
+
+    async def profile_devices(call):
+        bridge = get_bridge(hass, call.data.get(CONF_NAMESPACE))
+
+        async def profile():
+            profile = await bridge.async_profile(
+                call.data[ATTR_DURATION], call.data[ATTR_TOP]
+            )
+            _LOGGER.info(
+                "HomeSeer device profile for %s: %s",
+                bridge.namespace,
+                json.dumps(profile),
+            )
+            hass.bus.async_fire(
+                EVENT_PROFILE,
+                {CONF_NAMESPACE: bridge.namespace, ATTR_PROFILE: profile},
+                context=call.context,
+            )
+
+        # Sampling runs in the background so the service call returns immediately.
+        hass.async_create_task(profile())
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_DEVICES,
+        profile_devices,
+        schema=SERVICE_PROFILE_DEVICES_SCHEMA,
+    )
+
+    async def sync_catalog(call):
+        bridge = get_bridge(hass, call.data.get(CONF_NAMESPACE))
+        changes = await bridge.async_sync_catalog()
+        if changes is None:
+            raise HomeAssistantError(
+                f"Could not retrieve the HomeSeer devices for {bridge.namespace}"
+            )
+
+        hass.bus.async_fire(
+            EVENT_CATALOG_SYNCED,
+            {CONF_NAMESPACE: bridge.namespace, **changes},
+            context=call.context,
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SYNC_CATALOG,
+        sync_catalog,
+        schema=SERVICE_SYNC_CATALOG_SCHEMA,
+    )
+
     return True
 
 
+def get_bridge(hass, namespace=None) -> HomeSeerBridge:
+    """
+    Return the bridge for the HomeSeer instance with the given namespace.
+    The namespace may be omitted when only one HomeSeer instance is configured.
+    """
+    bridges = list(hass.data[DOMAIN].values())
+    if namespace is None:
+        if len(bridges) == 1:
+            return bridges[0]
+        raise HomeAssistantError(
+            "A namespace is required when more than one HomeSeer instance is configured"
+        )
+
+    for bridge in bridges:
+        if bridge.namespace == namespace:
+            return bridge
+    raise HomeAssistantError(f"No HomeSeer instance with namespace {namespace}")
+
+
+def get_platforms(config_entry) -> list:
+    """Return the platforms to set up for the config entry."""
+    if config_entry.data[CONF_ALLOW_EVENTS]:
+        return HOMESEER_PLATFORMS
+    return [platform for platform in HOMESEER_PLATFORMS if platform != "scene"]
+
+
+def get_entry_config(config_entry, key):
+    """Return a setting from the config entry, preferring a value changed in the options flow."""
+    return config_entry.options.get(key, config_entry.data[key])
+
+
 async def async_setup_entry(hass, config_entry):
     """Set up a HomeSeer config entry."""
+    start = monotonic()
     config = config_entry.data
 
     host = config[CONF_HOST]
@@ -60,15 +333,19 @@ async def async_setup_entry(hass, config_entry):
     http_port = config[CONF_HTTP_PORT]
     ascii_port = config[CONF_ASCII_PORT]
     name_template = template.Template(str(config[CONF_NAME_TEMPLATE]))
-    allow_events = config[CONF_ALLOW_EVENTS]
-    allowed_event_groups = config[CONF_ALLOWED_EVENT_GROUPS]
-    forced_covers = config[CONF_FORCED_COVERS]
-    allowed_interfaces = config[CONF_ALLOWED_INTERFACES]
+    allowed_event_groups = get_entry_config(config_entry, CONF_ALLOWED_EVENT_GROUPS)
+    forced_covers = get_entry_config(config_entry, CONF_FORCED_COVERS)
+    allowed_interfaces = get_entry_config(config_entry, CONF_ALLOWED_INTERFACES)
 
     name_template.hass = hass
 
+    # Entries created before multiple instances were supported have no unique ID; the namespace is used.
+    if config_entry.unique_id is None:
+        hass.config_entries.async_update_entry(config_entry, unique_id=namespace)
+
     bridge = HomeSeerBridge(
         hass,
+        config_entry.entry_id,
         host,
         username,
         password,
@@ -79,6 +356,7 @@ async def async_setup_entry(hass, config_entry):
         allowed_event_groups,
         forced_covers,
         allowed_interfaces,
+        config_entry.options,
     )
 
     try:
@@ -86,58 +364,76 @@ async def async_setup_entry(hass, config_entry):
             _LOGGER.error(
                 f"No supported HomeSeer devices or events found, aborting entry setup for {host}."
             )
-    except asyncio.TimeoutError:
-        _LOGGER.error(f"Could not connect to HomeSeer at {host}, aborting entry setup.")
-        return False
+    except (asyncio.TimeoutError, ConfigEntryNotReady) as ex:
+        # Setup is retried in the background without holding up other HomeSeer config entries.
+        await bridge.async_close()
+        raise ConfigEntryNotReady(f"Could not connect to HomeSeer at {host}") from ex
 
     await bridge.start()
-    attempts = 0
-    while not bridge.api.available:
-        if attempts < 5:
-            attempts += 1
-            await asyncio.sleep(5)
-            continue
-        _LOGGER.error(
-            f"Failed to connect to HomeSeer ASCII connection at {host}:{ascii_port}, aborting entry setup."
-        )
-        await bridge.stop()
-        return False
 
-    if not allow_events:
-        HOMESEER_PLATFORMS.remove("scene")
+    hass.data[DOMAIN][config_entry.entry_id] = bridge
+    bridge.async_register_devices(config_entry.entry_id)
 
-    hass.data[DOMAIN] = bridge
-
-    for platform in HOMESEER_PLATFORMS:
+    # The platform setups cannot be awaited here: each one waits for the homeseer component to finish
+    # setting up, which includes this entry. The total setup time is logged once they have all completed.
+    platform_setups = [
         hass.async_create_task(
             hass.config_entries.async_forward_entry_setup(config_entry, platform)
         )
+        for platform in get_platforms(config_entry)
+    ]
 
-    hass.bus.async_listen_once("homeassistant_stop", bridge.stop)
-
-    async def control_device_by_value(call):
-        ref = call.data[ATTR_REF]
-        value = call.data[ATTR_VALUE]
+    async def async_log_setup_time():
+        await asyncio.gather(*platform_setups)
+        bridge.setup_time = round(monotonic() - start, 3)
+        _LOGGER.info(
+            "Set up HomeSeer at %s with %s devices and %s events in %.3f seconds",
+            host,
+            len(bridge.registry),
+            len(bridge.events),
+            bridge.setup_time,
+        )
 
-        await bridge.api.control_device_by_value(ref, value)
+    hass.async_create_task(async_log_setup_time())
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CONTROL_DEVICE_BY_VALUE,
-        control_device_by_value,
-        schema=SERVICE_CONTROL_DEVICE_BY_VALUE_SCHEMA,
+    config_entry.async_on_unload(
+        hass.bus.async_listen_once("homeassistant_stop", bridge.stop)
     )
+    config_entry.async_on_unload(config_entry.add_update_listener(async_update_options))
 
     return True
 
 
+async def async_update_options(hass, config_entry):
+    """Apply updated options to the running HomeSeer bridge."""
+    bridge = hass.data[DOMAIN][config_entry.entry_id]
+    if get_session_options(config_entry.options) != bridge.session_options:
+        # The connection pool settings only apply to a new HTTP session, so the entry is reloaded
+        # (which applies the other options as well).
+        hass.async_create_task(hass.config_entries.async_reload(config_entry.entry_id))
+        return
+    bridge.update_options(config_entry.options)
+    await bridge.async_reconfigure(
+        get_entry_config(config_entry, CONF_ALLOWED_INTERFACES),
+        get_entry_config(config_entry, CONF_ALLOWED_EVENT_GROUPS),
+        get_entry_config(config_entry, CONF_FORCED_COVERS),
+    )
+
+
+async def async_remove_entry(hass, config_entry):
+    """Remove the stored catalog snapshot when the config entry is removed."""
+    await Store(
+        hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}"
+    ).async_remove()
+
+
 async def async_unload_entry(hass, config_entry):
     """Unload the config entry and platforms."""
-    bridge = hass.data.pop(DOMAIN)
+    bridge = hass.data[DOMAIN].pop(config_entry.entry_id)
     await bridge.stop()
 
     tasks = []
-    for platform in HOMESEER_PLATFORMS:
+    for platform in get_platforms(config_entry):
         tasks.append(
             hass.config_entries.async_forward_entry_unload(config_entry, platform)
         )
@@ -0,0 +1,455 @@
+"""Extends the libhomeseer HomeSeer client for use by the HomeSeer integration."""
+
+import asyncio
+from collections import namedtuple
+import logging
+import random
+from time import monotonic
+from typing import Awaitable, Callable, Optional
+
+from aiohttp import ClientSession, ClientTimeout, ContentTypeError, TCPConnector
+from libhomeseer import (
+    DEFAULT_ASCII_PORT,
+    DEFAULT_HTTP_PORT,
+    DEFAULT_PASSWORD,
+    DEFAULT_USERNAME,
+    HomeSeer,
+)
+from libhomeseer.devices import get_device
+from libhomeseer.events import HomeSeerEvent
+from libhomeseer.listener import STATE_STOPPED, Listener
+
+from .const import (
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DNS_CACHE_TTL,
+    REQUEST_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+CATALOG_DEVICES = "devices"
+CATALOG_CONTROLS = "controls"
+CATALOG_EVENTS = "events"
+
+# Only the fields used by libhomeseer and this integration are kept in the catalog.
+DEVICE_KEYS = (
+    "ref",
+    "name",
+    "location",
+    "location2",
+    "value",
+    "status",
+    "device_type_string",
+    "last_change",
+    "relationship",
+    "associated_devices",
+    "interface_name",
+)
+CONTROL_PAIR_KEYS = ("ControlUse", "ControlValue", "Label")
+# Fields compared to detect devices that were renamed, moved or changed type or interface in HomeSeer.
+FINGERPRINT_KEYS = (
+    "name",
+    "location",
+    "location2",
+    "device_type_string",
+    "interface_name",
+)
+DeviceFingerprint = namedtuple("DeviceFingerprint", FINGERPRINT_KEYS)
+EVENT_KEYS = ("Group", "Name")
+
+RECONNECT_MIN_DELAY = 1
+RECONNECT_MAX_DELAY = 300
+
+
+def create_session(
+    connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+) -> ClientSession:
+    """
+    Return a session with a dedicated connection pool for a single HomeSeer host: at most connection_limit
+    connections are opened at once (further requests wait for a free connection), idle connections are kept
+    alive for keepalive_timeout seconds and DNS lookups of the host are cached.
+    """
+    return ClientSession(
+        connector=TCPConnector(
+            limit_per_host=connection_limit,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        ),
+        timeout=ClientTimeout(total=REQUEST_TIMEOUT),
+    )
+
+
+class HomeSeerListener(Listener):
+    """ASCII listener that reconnects with exponential backoff and jitter, and never gives up until stopped."""
+
+    def __init__(self, host: str, **kwargs) -> None:
+        super().__init__(host, **kwargs)
+        self._attempts = 0
+
+    async def _open_connection(self) -> bool:
+        """Connect and login to HomeSeer ASCII, resetting the backoff after a successful login."""
+        if await super()._open_connection():
+            self._attempts = 0
+            return True
+        return False
+
+    async def _connect_handler(self) -> None:
+        """Attempt to connect/reconnect after an exponentially increasing, jittered delay."""
+        if self.state == STATE_STOPPED:
+            return
+
+        delay = min(
+            RECONNECT_MAX_DELAY, RECONNECT_MIN_DELAY * 2 ** min(self._attempts, 16)
+        )
+        delay = random.uniform(delay / 2, delay)
+        self._attempts += 1
+        _LOGGER.info(
+            "Attempting to connect ASCII listener to %s:%s in %.1f seconds (attempt %s)",
+            self._host,
+            self._port,
+            delay,
+            self._attempts,
+        )
+        await asyncio.sleep(delay)
+        if self.state != STATE_STOPPED:
+            await self.start()
+
+
+class HomeSeerAPI(HomeSeer):
+    """
+    HomeSeer client whose device and event catalog can be fetched as, and loaded from, a serializable dict.
+    The catalog has the following format:
+    {
+        "devices": [raw device data from "getstatus"],
+        "controls": {"<ref>": [control pairs from "getcontrol"]},
+        "events": [raw event data from "getevents"],
+    }
+    The ASCII listener reconnects with backoff, only devices that changed while disconnected are refreshed
+    on reconnect, and connection_callback (if provided) is called with True or False on every
+    connection state change. When metrics is set to a HomeSeerMetrics collector, request and
+    device update latencies are recorded.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        websession: ClientSession,
+        username: str = DEFAULT_USERNAME,
+        password: str = DEFAULT_PASSWORD,
+        http_port: int = DEFAULT_HTTP_PORT,
+        ascii_port: int = DEFAULT_ASCII_PORT,
+        connection_callback: Optional[Callable] = None,
+    ) -> None:
+        super().__init__(
+            host,
+            websession,
+            username=username,
+            password=password,
+            http_port=http_port,
+            ascii_port=ascii_port,
+        )
+        self._listener = HomeSeerListener(
+            self._host,
+            username=username,
+            password=password,
+            ascii_port=ascii_port,
+            async_message_callback=self._message_callback,
+            async_connect_callback=self._connect_callback,
+            async_disconnect_callback=self._disconnect_callback,
+        )
+        self._connection_callback = connection_callback
+        self.metrics = None
+        self.profiler = None
+        self._fingerprints = {}
+        self._connection_update = False
+
+    @property
+    def connection_update(self) -> bool:
+        """
+        Return True while devices are notified of a connection change or catalog update (updates with the
+        connection flag set) rather than of a change reported by HomeSeer for the device.
+        """
+        return self._connection_update
+
+    async def fetch_catalog(self) -> Optional[dict]:
+        """Retrieve the device and event catalog from HomeSeer without changing the loaded devices and events."""
+        _LOGGER.debug("Requesting HomeSeer catalog from %s", self._host)
+        status = await self._request("get", params={"request": "getstatus"})
+        control = await self._request("get", params={"request": "getcontrol"})
+        events = await self._request("get", params={"request": "getevents"})
+
+        try:
+            return {
+                CATALOG_DEVICES: [
+                    {key: raw_device.get(key) for key in DEVICE_KEYS}
+                    for raw_device in status["Devices"]
+                ],
+                CATALOG_CONTROLS: {
+                    str(item["ref"]): [
+                        {key: pair.get(key) for key in CONTROL_PAIR_KEYS}
+                        for pair in item["ControlPairs"]
+                    ]
+                    for item in control["Devices"]
+                },
+                CATALOG_EVENTS: [
+                    {key: raw_event.get(key) for key in EVENT_KEYS}
+                    for raw_event in events["Events"]
+                ],
+            }
+        except (KeyError, TypeError):
+            _LOGGER.error("Error retrieving HomeSeer catalog from %s", self._host)
+            return None
+
+    async def fetch_devices(self) -> Optional[list]:
+        """Retrieve the raw data of all devices from HomeSeer with a single "getstatus" request."""
+        status = await self._request("get", params={"request": "getstatus"})
+        try:
+            return [
+                {key: raw_device.get(key) for key in DEVICE_KEYS}
+                for raw_device in status["Devices"]
+            ]
+        except (KeyError, TypeError):
+            _LOGGER.error("Error retrieving HomeSeer devices from %s", self._host)
+            return None
+
+    async def fetch_controls(self, refs: list) -> Optional[dict]:
+        """Retrieve the control pairs of the given device refs only, in the catalog's controls format."""
+        controls = {}
+        for ref in refs:
+            control = await self._request(
+                "get", params={"request": "getcontrol", "ref": ref}
+            )
+            try:
+                controls[str(ref)] = [
+                    {key: pair.get(key) for key in CONTROL_PAIR_KEYS}
+                    for item in control["Devices"]
+                    for pair in item["ControlPairs"]
+                ]
+            except (KeyError, TypeError):
+                _LOGGER.error(
+                    "Error retrieving HomeSeer controls for device ref %s from %s",
+                    ref,
+                    self._host,
+                )
+                return None
+        return controls
+
+    def load_catalog(self, catalog: dict) -> None:
+        """Replace the loaded devices and events with those described by the catalog."""
+        controls = catalog[CATALOG_CONTROLS]
+
+        self._devices.clear()
+        self._fingerprints.clear()
+        for raw_device in catalog[CATALOG_DEVICES]:
+            self.add_device(raw_device, controls.get(str(raw_device["ref"]), []))
+
+        self._events.clear()
+        for raw_event in catalog[CATALOG_EVENTS]:
+            self._events.append(HomeSeerEvent(raw_event, self._request))
+
+    def add_device(self, raw_device: dict, control_pairs: list):
+        """Create a device from its raw data and control pairs, replacing any loaded device with the same ref."""
+        control_data = [{"ref": raw_device["ref"], "ControlPairs": control_pairs}]
+        device = get_device(raw_device, control_data, self._request)
+        self._devices[device.ref] = device
+        self._fingerprints[device.ref] = get_fingerprint(raw_device)
+        return device
+
+    def update_device(self, raw_device: dict) -> None:
+        """
+        Replace the raw data of a loaded device (e.g. after it was renamed in HomeSeer).
+        The update is flagged like a connection update, so that remotes (which suppress those) do not
+        fire an event as if the device had been operated.
+        """
+        ref = int(raw_device["ref"])
+        self._fingerprints[ref] = get_fingerprint(raw_device)
+        self._connection_update = True
+        try:
+            self._devices[ref].update_data(new_data=raw_device, connection_flag=True)
+        finally:
+            self._connection_update = False
+
+    def remove_device(self, ref: int) -> None:
+        """Remove a loaded device."""
+        self._devices.pop(ref, None)
+        self._fingerprints.pop(ref, None)
+
+    def get_fingerprint(self, ref: int) -> Optional[DeviceFingerprint]:
+        """Return the fingerprint of a loaded device, or None if no device with the ref is loaded."""
+        return self._fingerprints.get(ref)
+
+    async def control_devices_by_value(
+        self,
+        values: dict,
+        limit: int,
+        send: Callable[[int, Callable[[], Awaitable]], Awaitable[bool]],
+    ) -> list:
+        """
+        Control several devices by value concurrently, with at most limit requests to HomeSeer in flight.
+        values maps device refs to values; each request is passed to send (e.g. a command queue's async_send)
+        with its ref, which returns False if the request was superseded instead of sent.
+        Returns a list of per-ref results with the elapsed time in seconds.
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def control(ref: int, value: int) -> dict:
+            async with semaphore:
+                start = monotonic()
+                params = {"request": "controldevicebyvalue", "ref": ref, "value": value}
+                result = None
+
+                async def request() -> None:
+                    nonlocal result
+                    result = await self._request("get", params=params)
+
+                sent = await send(ref, request)
+                return {
+                    "ref": ref,
+                    "value": value,
+                    "success": result is not None,
+                    "superseded": not sent,
+                    "elapsed": round(monotonic() - start, 3),
+                }
+
+        return await asyncio.gather(
+            *(control(ref, value) for ref, value in values.items())
+        )
+
+    async def run_events(self, events: list, limit: int) -> list:
+        """
+        Run several events concurrently, with at most limit requests to HomeSeer in flight.
+        Returns a list of per-event results with the elapsed time in seconds.
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(event: HomeSeerEvent) -> dict:
+            async with semaphore:
+                start = monotonic()
+                json = {"action": "runevent", "group": event.group, "name": event.name}
+                result = await self._request("post", json=json)
+                return {
+                    "group": event.group,
+                    "name": event.name,
+                    "success": result is not None,
+                    "elapsed": round(monotonic() - start, 3),
+                }
+
+        return await asyncio.gather(*(run(event) for event in events))
+
+    async def _request(self, method, params=None, json=None) -> Optional[dict]:
+        """Make a request to the HomeSeer JSON API, recording its latency when metrics are enabled."""
+        metrics = self.metrics
+        if metrics is None:
+            return await self._send_request(method, params, json)
+
+        start = monotonic()
+        try:
+            return await self._send_request(method, params, json)
+        finally:
+            metrics.record_request(
+                params.get("request") if params is not None else None,
+                monotonic() - start,
+            )
+
+    async def _send_request(self, method, params, json) -> Optional[dict]:
+        """
+        Make a request to the HomeSeer JSON API, returning None on failure.
+        Unlike libhomeseer, the response body is read once and only formatted for the log when debug logging is enabled.
+        """
+        url = f"http://{self._host}:{self._http_port}/JSON"
+        try:
+            async with self._websession.request(
+                method, url, params=params, json=json, auth=self._auth
+            ) as result:
+                result.raise_for_status()
+                data = await result.json()
+        except ContentTypeError:
+            _LOGGER.debug("HomeSeer returned non-JSON response from %s", self._host)
+            return None
+        except asyncio.TimeoutError:
+            _LOGGER.error("Timeout while requesting HomeSeer data from %s", self._host)
+            return None
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.error("HomeSeer HTTP Request error from %s: %s", self._host, ex)
+            return None
+
+        _LOGGER.debug("HomeSeer request response from %s: %s", self._host, data)
+        return data
+
+    async def _message_callback(self, device_ref: str) -> None:
+        """Called by the ASCII listener when a Device Change message is received."""
+        if self.profiler is not None:
+            self.profiler.record_update(int(device_ref))
+
+        metrics = self.metrics
+        if metrics is None:
+            await super()._message_callback(device_ref)
+            return
+
+        start = monotonic()
+        await super()._message_callback(device_ref)
+        device = self._devices.get(int(device_ref))
+        if device is not None:
+            metrics.record_update(device.device_type_string, monotonic() - start)
+
+    async def _connect_callback(self) -> None:
+        """
+        Called by the ASCII listener after an ASCII connection is established.
+        Sets availability to True and refreshes only the data of devices that changed while disconnected;
+        all other devices are notified of the connection without new data.
+        """
+        _LOGGER.debug(
+            "Refreshing changed devices for %s and setting availability to True",
+            self._host,
+        )
+        self._available = True
+
+        result = await self._request("get", params={"request": "getstatus"})
+        try:
+            homeseer_devices = {int(raw["ref"]): raw for raw in result["Devices"]}
+        except (KeyError, TypeError):
+            _LOGGER.error("Error refreshing HomeSeer data from %s", self._host)
+            homeseer_devices = {}
+
+        self._connection_update = True
+        for ref, device in self._devices.items():
+            raw_device = homeseer_devices.get(ref)
+            try:
+                if raw_device is not None and (
+                    raw_device["value"] != device.value
+                    or raw_device["status"] != device.status
+                    or raw_device["last_change"] != device.last_change
+                ):
+                    device.update_data(
+                        new_data={key: raw_device.get(key) for key in DEVICE_KEYS},
+                        connection_flag=True,
+                    )
+                else:
+                    device.update_data(connection_flag=True)
+            except Exception:  # pylint: disable=broad-except
+                # This runs inside the listener's connection handler; an error escaping here would
+                # stop the listener from ever reconnecting, so a failing device is logged and skipped.
+                _LOGGER.exception(
+                    "Error refreshing HomeSeer device ref %s after connecting", ref
+                )
+        self._connection_update = False
+
+        if self._connection_callback is not None:
+            self._connection_callback(True)
+
+    async def _disconnect_callback(self) -> None:
+        """Called by the ASCII listener after an ASCII connection is disconnected."""
+        self._connection_update = True
+        try:
+            await super()._disconnect_callback()
+        finally:
+            self._connection_update = False
+        if self._connection_callback is not None:
+            self._connection_callback(False)
+
+
+def get_fingerprint(raw_device: dict) -> DeviceFingerprint:
+    """Return the fields of a raw device that identify its name, location, type and interface."""
+    return DeviceFingerprint(*(raw_device.get(key) for key in FINGERPRINT_KEYS))
@@ -12,18 +12,10 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up HomeSeer binary-sensor-type devices."""
-    binary_sensor_entities = []
-    bridge = hass.data[DOMAIN]
-
-    for device in bridge.devices["binary_sensor"]:
-        entity = HomeSeerBinarySensor(device, bridge)
-        binary_sensor_entities.append(entity)
-        _LOGGER.info(
-            f"Added HomeSeer binary-sensor-type device: {entity.name} ({entity.device_state_attributes})"
-        )
-
-    if binary_sensor_entities:
-        async_add_entities(binary_sensor_entities)
+    bridge = hass.data[DOMAIN][config_entry.entry_id]
+    bridge.async_setup_platform(
+        "binary_sensor", async_add_entities, HomeSeerBinarySensor
+    )
 
 
 class HomeSeerBinarySensor(HomeSeerEntity, BinarySensorEntity):
@@ -0,0 +1,81 @@
+"""Outbound command queue for HomeSeer devices with per-ref last-write-wins collapsing."""
+
+import logging
+from typing import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HomeSeerCommandQueue:
+    """
+    Sends commands to HomeSeer one at a time per device ref.
+    While a command for a ref is in flight, only the latest command queued for that ref is kept;
+    commands it replaces are dropped without being sent, so that e.g. dragging a brightness slider
+    sends the final level once the in-flight request completes rather than every intermediate level.
+    Commands for different refs are sent independently.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._pending = {}
+        self._in_flight = {}
+        self._workers = {}
+        self.sent = 0
+        self.superseded = 0
+
+    async def async_send(self, ref: int, command: Callable[[], Awaitable]) -> bool:
+        """
+        Queue command (a callable returning an awaitable) for the given ref and wait until it has been sent.
+        Returns True once the command has completed, or False if a newer command for the ref replaced it.
+        """
+        future = self._hass.loop.create_future()
+        previous = self._pending.get(ref)
+        if previous is not None:
+            self.superseded += 1
+            if not previous[1].done():
+                previous[1].set_result(False)
+        self._pending[ref] = (command, future)
+
+        if ref not in self._workers:
+            self._workers[ref] = self._hass.async_create_task(self._async_worker(ref))
+
+        return await future
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel all in-flight and queued commands."""
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
+        for future in self._in_flight.values():
+            future.cancel()
+        self._in_flight.clear()
+        for _, future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    async def _async_worker(self, ref: int) -> None:
+        """Send the latest queued command for ref until no commands are left."""
+        try:
+            while ref in self._pending:
+                command, future = self._pending.pop(ref)
+                # Kept until the command completes, so that async_stop can cancel the future of a command
+                # whose send it interrupts.
+                self._in_flight[ref] = future
+                try:
+                    await command()
+                except Exception as ex:  # pylint: disable=broad-except
+                    _LOGGER.error(
+                        "Error sending command to HomeSeer device ref %s: %s", ref, ex
+                    )
+                    if not future.done():
+                        future.set_exception(ex)
+                    continue
+                self.sent += 1
+                if not future.done():
+                    future.set_result(True)
+        finally:
+            self._in_flight.pop(ref, None)
+            self._workers.pop(ref, None)
@@ -18,6 +18,7 @@ from homeassistant.const import (
     CONF_PASSWORD,
     CONF_USERNAME,
 )
+from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
@@ -27,17 +28,47 @@ from .const import (
     CONF_ALLOWED_EVENT_GROUPS,
     CONF_ALLOWED_INTERFACES,
     CONF_ASCII_PORT,
+    CONF_CONFIGURE_DEVICES,
+    CONF_CONNECTION_LIMIT,
+    CONF_DEADBAND,
+    CONF_FILTER_MIN_INTERVAL,
+    CONF_FILTER_TARGET,
     CONF_FORCED_COVERS,
     CONF_HTTP_PORT,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_MAX_AGE,
+    CONF_METRICS,
     CONF_NAME_TEMPLATE,
     CONF_NAMESPACE,
+    CONF_OPTIMISTIC,
+    CONF_RELATIVE_DEADBAND,
+    CONF_REMOTE_DEBOUNCE,
+    CONF_REMOTE_EVENT_PER_REF,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_STATIC_ATTRIBUTES,
+    CONF_SYNC_INTERVAL,
+    CONF_UPDATE_FILTERS,
+    CONF_UPDATE_WINDOW,
     DEFAULT_ALLOW_EVENTS,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_KEEPALIVE_TIMEOUT,
     DEFAULT_NAME_TEMPLATE,
     DEFAULT_NAMESPACE,
+    DEFAULT_OPTIMISTIC,
     DEFAULT_INTERFACE_NAME,
+    DEFAULT_METRICS,
+    DEFAULT_REMOTE_DEBOUNCE,
+    DEFAULT_REMOTE_EVENT_PER_REF,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    DEFAULT_STATIC_ATTRIBUTES,
+    DEFAULT_SYNC_INTERVAL,
+    DEFAULT_UPDATE_WINDOW,
     DOMAIN,
 )
+from .filters import filter_key
 from .homeseer_quirks import HOMESEER_QUIRKS
+from .registry import get_interface_name
+from .sensor import VALUE_SENSOR_TYPES
 
 USER_STEP_SCHEMA = vol.Schema(
     {
@@ -86,13 +117,15 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._cover_flag = True
         self._forced_covers = []
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow for the HomeSeer integration."""
+        return OptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None):
         """Basic data for the HomeSeer instance is provided by the user."""
         errors = {}
-        if self._async_current_entries():
-            # Config entry already exists, only one allowed for now.
-            return self.async_abort(reason="single_instance_allowed")
-
         if user_input is not None:
             bridge = HomeSeer(
                 user_input[CONF_HOST],
@@ -136,6 +169,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._namespace = user_input[CONF_NAMESPACE]
             self._allow_events = user_input[CONF_ALLOW_EVENTS]
 
+            # The namespace identifies the HomeSeer instance, so it must be unique across config entries.
+            # Entries created before multiple instances were supported may not have a unique ID yet.
+            await self.async_set_unique_id(self._namespace)
+            self._abort_if_unique_id_configured()
+            for entry in self._async_current_entries():
+                if entry.data.get(CONF_NAMESPACE) == self._namespace:
+                    return self.async_abort(reason="already_configured")
+
             try:
                 cv.template(str(user_input[CONF_NAME_TEMPLATE]))
                 self._name_template = user_input[CONF_NAME_TEMPLATE]
@@ -267,3 +308,237 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_ALLOWED_INTERFACES: self._allowed_interfaces,
             },
         )
+
+
+class OptionsFlow(config_entries.OptionsFlow):
+    """Handle HomeSeer options."""
+
+    def __init__(self, config_entry):
+        self.config_entry = config_entry
+        self._options = dict(config_entry.options)
+        self._bridge = None
+
+    def _get_config(self, key):
+        """Return the current value of a setting that can be changed from the initial configuration."""
+        return self._options.get(key, self.config_entry.data[key])
+
+    async def async_step_init(self, user_input=None):
+        """State write tuning options are provided by the user."""
+        self._bridge = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+
+        if user_input is not None:
+            configure_devices = user_input.pop(CONF_CONFIGURE_DEVICES, False)
+            self._options.update(user_input)
+            if self._bridge is None:
+                return self.async_create_entry(title="", data=self._options)
+            if configure_devices:
+                return await self.async_step_interfaces()
+            return await self.async_step_filters()
+
+        options = self.config_entry.options
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_UPDATE_WINDOW,
+                        default=options.get(CONF_UPDATE_WINDOW, DEFAULT_UPDATE_WINDOW),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_SENSOR_MIN_INTERVAL,
+                        default=options.get(
+                            CONF_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_MIN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_STATIC_ATTRIBUTES,
+                        default=options.get(
+                            CONF_STATIC_ATTRIBUTES, DEFAULT_STATIC_ATTRIBUTES
+                        ),
+                    ): cv.boolean,
+                    vol.Required(
+                        CONF_METRICS,
+                        default=options.get(CONF_METRICS, DEFAULT_METRICS),
+                    ): cv.boolean,
+                    vol.Required(
+                        CONF_OPTIMISTIC,
+                        default=options.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC),
+                    ): cv.boolean,
+                    vol.Required(
+                        CONF_CONNECTION_LIMIT,
+                        default=options.get(
+                            CONF_CONNECTION_LIMIT, DEFAULT_CONNECTION_LIMIT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Required(
+                        CONF_KEEPALIVE_TIMEOUT,
+                        default=options.get(
+                            CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_REMOTE_DEBOUNCE,
+                        default=options.get(
+                            CONF_REMOTE_DEBOUNCE, DEFAULT_REMOTE_DEBOUNCE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_REMOTE_EVENT_PER_REF,
+                        default=options.get(
+                            CONF_REMOTE_EVENT_PER_REF, DEFAULT_REMOTE_EVENT_PER_REF
+                        ),
+                    ): cv.boolean,
+                    vol.Required(
+                        CONF_SYNC_INTERVAL,
+                        default=options.get(CONF_SYNC_INTERVAL, DEFAULT_SYNC_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(CONF_CONFIGURE_DEVICES, default=False): cv.boolean,
+                }
+            ),
+        )
+
+    async def async_step_interfaces(self, user_input=None):
+        """Allowed HomeSeer device interfaces are changed by the user, using the bridge's loaded catalog."""
+        if user_input is not None:
+            self._options[CONF_ALLOWED_INTERFACES] = user_input[CONF_ALLOWED_INTERFACES]
+            if self.config_entry.data[CONF_ALLOW_EVENTS]:
+                return await self.async_step_groups()
+            return await self.async_step_covers()
+
+        interfaces = sorted(self._bridge.registry.interface_names())
+
+        return self.async_show_form(
+            step_id="interfaces",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_ALLOWED_INTERFACES,
+                        default=[
+                            iname
+                            for iname in self._get_config(CONF_ALLOWED_INTERFACES)
+                            if iname in interfaces
+                        ],
+                    ): cv.multi_select(interfaces),
+                }
+            ),
+        )
+
+    async def async_step_groups(self, user_input=None):
+        """Allowed HomeSeer event groups are changed by the user."""
+        if user_input is not None:
+            self._options[CONF_ALLOWED_EVENT_GROUPS] = user_input.get(
+                CONF_ALLOWED_EVENT_GROUPS, []
+            )
+            return await self.async_step_covers()
+
+        event_groups = sorted({event.group for event in self._bridge.api.events})
+
+        return self.async_show_form(
+            step_id="groups",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_ALLOWED_EVENT_GROUPS,
+                        default=[
+                            group
+                            for group in self._get_config(CONF_ALLOWED_EVENT_GROUPS)
+                            if group in event_groups
+                        ],
+                    ): cv.multi_select(event_groups)
+                }
+            ),
+        )
+
+    async def async_step_covers(self, user_input=None):
+        """Devices to force as covers are changed by the user."""
+        if user_input is not None:
+            self._options[CONF_FORCED_COVERS] = user_input.get(CONF_FORCED_COVERS, [])
+            return await self.async_step_filters()
+
+        allowed_interfaces = self._get_config(CONF_ALLOWED_INTERFACES)
+        switches = sorted(
+            device.ref
+            for device in self._bridge.api.devices.values()
+            if isinstance(device, HomeSeerSwitchableDevice)
+            and get_interface_name(device) in allowed_interfaces
+        )
+
+        return self.async_show_form(
+            step_id="covers",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_FORCED_COVERS,
+                        default=[
+                            ref
+                            for ref in self._get_config(CONF_FORCED_COVERS)
+                            if ref in switches
+                        ],
+                    ): cv.multi_select(switches)
+                }
+            ),
+        )
+
+    async def async_step_filters(self, user_input=None):
+        """An update filter for a sensor device type or device ref is optionally added, changed or removed by the user."""
+        if user_input is not None:
+            target = user_input.get(CONF_FILTER_TARGET)
+            if target is not None:
+                filters = dict(self._options.get(CONF_UPDATE_FILTERS, {}))
+                update_filter = {
+                    key: user_input[key]
+                    for key in (
+                        CONF_DEADBAND,
+                        CONF_RELATIVE_DEADBAND,
+                        CONF_FILTER_MIN_INTERVAL,
+                        CONF_MAX_AGE,
+                    )
+                    if user_input[key]
+                }
+                if update_filter:
+                    filters[target] = update_filter
+                else:
+                    filters.pop(target, None)
+                self._options[CONF_UPDATE_FILTERS] = filters
+            return self.async_create_entry(title="", data=self._options)
+
+        bridge = self._bridge
+        filters = self._options.get(CONF_UPDATE_FILTERS, {})
+        types = {}
+        refs = {}
+        for device in bridge.devices_for_platform("sensor"):
+            if device.device_type_string not in VALUE_SENSOR_TYPES:
+                continue
+            types[filter_key(device_type_string=device.device_type_string)] = (
+                f"Type: {device.device_type_string}"
+            )
+            refs[filter_key(ref=device.ref)] = (
+                f"Ref {device.ref}: {bridge.get_name(device)}"
+            )
+
+        targets = {}
+        for key in sorted(types) + sorted(refs, key=lambda key: refs[key]):
+            label = types.get(key) or refs[key]
+            targets[key] = f"{label} (filtered)" if key in filters else label
+
+        return self.async_show_form(
+            step_id="filters",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(CONF_FILTER_TARGET): vol.In(targets),
+                    vol.Required(CONF_DEADBAND, default=0): vol.All(
+                        vol.Coerce(float), vol.Range(min=0)
+                    ),
+                    vol.Required(CONF_RELATIVE_DEADBAND, default=0): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=100)
+                    ),
+                    vol.Required(CONF_FILTER_MIN_INTERVAL, default=0): vol.All(
+                        vol.Coerce(int), vol.Range(min=0)
+                    ),
+                    vol.Required(CONF_MAX_AGE, default=0): vol.All(
+                        vol.Coerce(int), vol.Range(min=0)
+                    ),
+                }
+            ),
+        )
@@ -10,6 +10,26 @@ ATTR_VALUE = "value"
 ATTR_STATUS = "status"
 ATTR_DEVICE_TYPE_STRING = "device_type_string"
 ATTR_LAST_CHANGE = "last_change"
+ATTR_DEVICES = "devices"
+ATTR_INTERFACE_NAME = "interface_name"
+ATTR_EVENTS = "events"
+ATTR_GROUP = "group"
+ATTR_ELAPSED = "elapsed"
+ATTR_RESULTS = "results"
+ATTR_METRICS = "metrics"
+ATTR_DURATION = "duration"
+ATTR_TOP = "top"
+ATTR_PROFILE = "profile"
+ATTR_SCENE = "scene"
+ATTR_KEY_PRESS = "key_press"
+
+EVENT_CONTROL_DEVICES_RESULT = f"{DOMAIN}_control_devices_result"
+EVENT_RUN_EVENTS_RESULT = f"{DOMAIN}_run_events_result"
+EVENT_METRICS = f"{DOMAIN}_metrics"
+EVENT_PROFILE = f"{DOMAIN}_profile"
+EVENT_CATALOG_SYNCED = f"{DOMAIN}_catalog_synced"
+
+ENTITY_CATEGORY_DIAGNOSTIC = "diagnostic"
 
 CONF_HTTP_PORT = "http_port"
 CONF_ASCII_PORT = "ascii_port"
@@ -19,6 +39,23 @@ CONF_NAME_TEMPLATE = "name_template"
 CONF_ALLOWED_EVENT_GROUPS = "allowed_event_groups"
 CONF_FORCED_COVERS = "forced_covers"
 CONF_ALLOWED_INTERFACES = "allowed_interfaces"
+CONF_UPDATE_WINDOW = "update_window"
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+CONF_STATIC_ATTRIBUTES = "static_attributes"
+CONF_METRICS = "metrics"
+CONF_CONFIGURE_DEVICES = "configure_devices"
+CONF_SYNC_INTERVAL = "sync_interval"
+CONF_UPDATE_FILTERS = "update_filters"
+CONF_REMOTE_DEBOUNCE = "remote_debounce"
+CONF_OPTIMISTIC = "optimistic"
+CONF_CONNECTION_LIMIT = "connection_limit"
+CONF_KEEPALIVE_TIMEOUT = "keepalive_timeout"
+CONF_REMOTE_EVENT_PER_REF = "remote_event_per_ref"
+CONF_FILTER_TARGET = "filter_target"
+CONF_DEADBAND = "deadband"
+CONF_RELATIVE_DEADBAND = "relative_deadband"
+CONF_FILTER_MIN_INTERVAL = "min_interval"
+CONF_MAX_AGE = "max_age"
 
 DEFAULT_NAME_TEMPLATE = "{{ device.location2 }} {{ device.location }} {{ device.name }}"
 DEFAULT_NAMESPACE = "homeseer"
@@ -26,6 +63,50 @@ DEFAULT_ALLOW_EVENTS = True
 DEFAULT_ALLOWED_EVENT_GROUPS = []
 DEFAULT_FORCED_COVERS = []
 DEFAULT_INTERFACE_NAME = "HomeSeer"
+DEFAULT_UPDATE_WINDOW = 0
+DEFAULT_SENSOR_MIN_INTERVAL = 0
+DEFAULT_STATIC_ATTRIBUTES = True
+DEFAULT_METRICS = False
+DEFAULT_SYNC_INTERVAL = 0
+DEFAULT_REMOTE_DEBOUNCE = 0
+DEFAULT_OPTIMISTIC = False
+DEFAULT_CONNECTION_LIMIT = 8
+DEFAULT_KEEPALIVE_TIMEOUT = 60
+DEFAULT_REMOTE_EVENT_PER_REF = False
+
+# Z-Wave Central Scene devices report <scene number> * 1000 + <key attribute> as their value.
+CENTRAL_SCENE_DIVISOR = 1000
+CENTRAL_SCENE_KEY_PRESSES = {
+    0: "pressed",
+    1: "released",
+    2: "held",
+    3: "pressed_2x",
+    4: "pressed_3x",
+    5: "pressed_4x",
+    6: "pressed_5x",
+}
+
+STORAGE_VERSION = 1
+
+MAX_CONCURRENT_COMMANDS = 8
+
+# Seconds to cache DNS lookups of the HomeSeer host and to wait for a HomeSeer JSON request to complete.
+DNS_CACHE_TTL = 300
+REQUEST_TIMEOUT = 30
+
+# Seconds to wait for HomeSeer to report a device update after a command in optimistic mode.
+OPTIMISTIC_TIMEOUT = 10
+
+DEFAULT_PROFILE_DURATION = 60
+DEFAULT_PROFILE_TOP = 10
+
+CATALOG_TIMEOUT = 60
+CATALOG_RETRY_INTERVAL = 60
+
+STATE_CONNECTING = "connecting"
+STATE_CONNECTED = "connected"
+STATE_RECONNECTING = "reconnecting"
+STATE_STOPPED = "stopped"
 
 HOMESEER_PLATFORMS = [
     "binary_sensor",
@@ -20,42 +20,26 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up HomeSeer cover-type devices."""
-    cover_entities = []
-    bridge = hass.data[DOMAIN]
-
-    for device in bridge.devices["cover"]:
-        if hasattr(device, "dim"):
-            """Device is a blind."""
-            entity = HomeSeerBlind(device, bridge)
-            cover_entities.append(entity)
-            _LOGGER.info(
-                f"Added HomeSeer blind-type device: {entity.name} ({entity.device_state_attributes})"
-            )
-        else:
-            """Device is a garage-door opener."""
-            entity = HomeSeerGarageDoor(device, bridge)
-            cover_entities.append(entity)
-            _LOGGER.info(
-                f"Added HomeSeer garage-type device: {entity.name} ({entity.device_state_attributes})"
-            )
-
-    if cover_entities:
-        async_add_entities(cover_entities)
+    bridge = hass.data[DOMAIN][config_entry.entry_id]
+    bridge.async_setup_platform("cover", async_add_entities, get_cover_entity)
 
 
 class HomeSeerCover(HomeSeerEntity, CoverEntity):
     """Base representation for a HomeSeer cover entity."""
 
     async def async_open_cover(self, **kwargs):
-        await self._device.on()
+        await self._async_command(self._device.on, **self._opening_state)
 
     async def async_close_cover(self, **kwargs):
-        await self._device.off()
+        await self._async_command(self._device.off, **self._closing_state)
 
 
 class HomeSeerGarageDoor(HomeSeerCover):
     """Representation of a garage door opener device."""
 
+    _opening_state = {"is_opening": True, "is_closing": False}
+    _closing_state = {"is_opening": False, "is_closing": True}
+
     @property
     def supported_features(self):
         """Return the features supported by the device."""
@@ -69,12 +53,12 @@ class HomeSeerGarageDoor(HomeSeerCover):
     @property
     def is_opening(self):
         """Return if the cover is opening or not."""
-        return self._device.status == "Opening"
+        return self._assumed("is_opening", self._device.status == "Opening")
 
     @property
     def is_closing(self):
         """Return if the cover is closing or not."""
-        return self._device.status == "Closing"
+        return self._assumed("is_closing", self._device.status == "Closing")
 
     @property
     def is_closed(self):
@@ -85,6 +69,9 @@ class HomeSeerGarageDoor(HomeSeerCover):
 class HomeSeerBlind(HomeSeerCover):
     """Representation of a window-covering device."""
 
+    _opening_state = {"is_closed": False, "current_cover_position": 100}
+    _closing_state = {"is_closed": True, "current_cover_position": 0}
+
     @property
     def supported_features(self):
         """Return the features supported by the device."""
@@ -98,12 +85,27 @@ class HomeSeerBlind(HomeSeerCover):
     @property
     def current_cover_position(self):
         """Return the current position of the cover."""
-        return int(self._device.dim_percent * 100)
+        return self._assumed(
+            "current_cover_position", int(self._device.dim_percent * 100)
+        )
 
     @property
     def is_closed(self):
         """Return if the cover is closed or not."""
-        return not self._device.is_on
+        return self._assumed("is_closed", not self._device.is_on)
 
     async def async_set_cover_position(self, **kwargs):
-        await self._device.dim(kwargs.get(ATTR_POSITION, 0))
+        position = kwargs.get(ATTR_POSITION, 0)
+        await self._async_command(
+            self._device.dim,
+            position,
+            is_closed=position == 0,
+            current_cover_position=position,
+        )
+
+
+def get_cover_entity(device, bridge):
+    """Return a blind for dimmable devices, otherwise a garage-door opener."""
+    if hasattr(device, "dim"):
+        return HomeSeerBlind(device, bridge)
+    return HomeSeerGarageDoor(device, bridge)
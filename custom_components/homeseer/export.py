@@ -0,0 +1,56 @@
+"""HTTP endpoint exporting the values of all HomeSeer devices in a single batch."""
+
+import json
+from typing import Callable
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.const import HTTP_NOT_FOUND
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import CONF_NAMESPACE, DOMAIN
+
+EXPORT_FORMAT_COLUMNS = "columns"
+EXPORT_FORMAT_NDJSON = "ndjson"
+
+
+class HomeSeerExportView(HomeAssistantView):
+    """
+    Export the values of all HomeSeer devices from the bridge's loaded catalog.
+    GET /api/homeseer/export returns a JSON object of columns (one list per field, all of the same length);
+    ?format=ndjson returns one JSON object per device per line instead. Devices can be filtered with one or more
+    interface and device_type_string query parameters, and namespace selects the HomeSeer instance.
+    """
+
+    url = f"/api/{DOMAIN}/export"
+    name = f"api:{DOMAIN}:export"
+
+    def __init__(self, get_bridge: Callable) -> None:
+        self._get_bridge = get_bridge
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the device values in the requested format."""
+        hass = request.app["hass"]
+        try:
+            bridge = self._get_bridge(hass, request.query.get(CONF_NAMESPACE))
+        except HomeAssistantError as ex:
+            return self.json_message(str(ex), HTTP_NOT_FOUND)
+
+        columns = bridge.export_values(
+            request.query.getall("interface", []),
+            request.query.getall("device_type_string", []),
+        )
+
+        if request.query.get("format", EXPORT_FORMAT_COLUMNS) != EXPORT_FORMAT_NDJSON:
+            return self.json(columns)
+
+        keys = list(columns)
+        lines = [
+            json.dumps(dict(zip(keys, row)))
+            for row in zip(*(columns[key] for key in keys))
+        ]
+        return web.Response(
+            text="\n".join(lines) + "\n" if lines else "",
+            content_type="application/x-ndjson",
+        )
@@ -0,0 +1,81 @@
+"""Deadband and rate filters applied to HomeSeer value sensor updates before their state is written."""
+
+from typing import Optional, Tuple
+
+from .const import (
+    CONF_DEADBAND,
+    CONF_FILTER_MIN_INTERVAL,
+    CONF_MAX_AGE,
+    CONF_RELATIVE_DEADBAND,
+)
+
+# Update filters are stored in the config entry options keyed by "ref:<ref>" or "type:<device type string>".
+FILTER_REF_PREFIX = "ref:"
+FILTER_TYPE_PREFIX = "type:"
+
+
+class UpdateFilter:
+    """
+    Filter for the updates of a single value sensor.
+    A change smaller than the absolute deadband, or smaller than the relative deadband (a percentage
+    of the last written value), is not written; the latest value is still written once max_age seconds
+    have passed since the last write. min_interval overrides the sensor minimum update interval.
+    """
+
+    __slots__ = ("deadband", "relative_deadband", "min_interval", "max_age")
+
+    def __init__(
+        self,
+        deadband: float = 0,
+        relative_deadband: float = 0,
+        min_interval: float = 0,
+        max_age: float = 0,
+    ) -> None:
+        self.deadband = deadband
+        self.relative_deadband = relative_deadband
+        self.min_interval = min_interval
+        self.max_age = max_age
+
+    @classmethod
+    def from_options(cls, options: dict) -> "UpdateFilter":
+        """Create a filter from its options (the minimum interval is stored in milliseconds)."""
+        return cls(
+            deadband=options.get(CONF_DEADBAND, 0),
+            relative_deadband=options.get(CONF_RELATIVE_DEADBAND, 0),
+            min_interval=options.get(CONF_FILTER_MIN_INTERVAL, 0) / 1000,
+            max_age=options.get(CONF_MAX_AGE, 0),
+        )
+
+    def suppresses(self, previous, value) -> bool:
+        """Return True if the change from the previous value to value falls within a deadband."""
+        change = abs(value - previous)
+        if self.deadband and change < self.deadband:
+            return True
+        if self.relative_deadband and change < abs(previous) * (
+            self.relative_deadband / 100
+        ):
+            return True
+        return False
+
+
+def parse_update_filters(filters: dict) -> Tuple[dict, dict]:
+    """Return the update filters stored in the options as a pair of dicts keyed by ref and by device type string."""
+    ref_filters = {}
+    type_filters = {}
+    for key, options in filters.items():
+        if key.startswith(FILTER_REF_PREFIX):
+            ref_filters[int(key[len(FILTER_REF_PREFIX) :])] = UpdateFilter.from_options(
+                options
+            )
+        elif key.startswith(FILTER_TYPE_PREFIX):
+            type_filters[key[len(FILTER_TYPE_PREFIX) :]] = UpdateFilter.from_options(
+                options
+            )
+    return ref_filters, type_filters
+
+
+def filter_key(ref: Optional[int] = None, device_type_string: Optional[str] = None):
+    """Return the options key of the update filter for a ref or a device type string."""
+    if ref is not None:
+        return f"{FILTER_REF_PREFIX}{ref}"
+    return f"{FILTER_TYPE_PREFIX}{device_type_string}"
@@ -1,7 +1,7 @@
 """Provides HomeSeer specific implementations for bridges, entities, and remotes."""
 
 from libhomeseer import (
-    HomeSeer,
+    DEVICE_ZWAVE_CENTRAL_SCENE,
     HomeSeerStatusDevice,
     HomeSeerSwitchableDevice,
     HomeSeerLockableDevice,
@@ -10,41 +10,95 @@ from libhomeseer import (
     RELATIONSHIP_CHILD,
     RELATIONSHIP_ROOT,
 )
+import asyncio
+from datetime import timedelta
+from functools import partial
 import logging
-from typing import Optional, Union
+from time import monotonic
+from types import MappingProxyType
+from typing import Any, Callable, Optional, Union
 
 from homeassistant.const import CONF_EVENT, CONF_ID
-from homeassistant.core import EventOrigin, HomeAssistant
-from homeassistant.helpers import aiohttp_client, template
+from homeassistant.core import EventOrigin, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers import (
+    device_registry,
+    entity_registry,
+    template,
+)
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
 
 from .const import (
+    ATTR_GROUP,
+    ATTR_KEY_PRESS,
     ATTR_REF,
+    ATTR_SCENE,
     ATTR_LOCATION,
     ATTR_LOCATION2,
     ATTR_NAME,
     ATTR_VALUE,
     ATTR_STATUS,
     ATTR_DEVICE_TYPE_STRING,
+    ATTR_INTERFACE_NAME,
     ATTR_LAST_CHANGE,
-    DEFAULT_INTERFACE_NAME,
+    CATALOG_RETRY_INTERVAL,
+    CATALOG_TIMEOUT,
+    CENTRAL_SCENE_DIVISOR,
+    CONF_CONNECTION_LIMIT,
+    CONF_KEEPALIVE_TIMEOUT,
+    CENTRAL_SCENE_KEY_PRESSES,
+    CONF_METRICS,
+    CONF_NAMESPACE,
+    CONF_OPTIMISTIC,
+    CONF_REMOTE_DEBOUNCE,
+    CONF_REMOTE_EVENT_PER_REF,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_STATIC_ATTRIBUTES,
+    CONF_SYNC_INTERVAL,
+    CONF_UPDATE_FILTERS,
+    CONF_UPDATE_WINDOW,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_METRICS,
+    DEFAULT_NAME_TEMPLATE,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_REMOTE_DEBOUNCE,
+    DEFAULT_REMOTE_EVENT_PER_REF,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    DEFAULT_STATIC_ATTRIBUTES,
+    DEFAULT_SYNC_INTERVAL,
+    DEFAULT_UPDATE_WINDOW,
     DOMAIN,
+    OPTIMISTIC_TIMEOUT,
+    STATE_CONNECTED,
+    STATE_CONNECTING,
+    STATE_RECONNECTING,
+    STATE_STOPPED,
+    STORAGE_VERSION,
+)
+from .api import (
+    CATALOG_CONTROLS,
+    CATALOG_DEVICES,
+    CATALOG_EVENTS,
+    HomeSeerAPI,
+    create_session,
+    get_fingerprint,
 )
-from .homeseer_quirks import HOMESEER_QUIRKS
+from .commands import HomeSeerCommandQueue
+from .filters import UpdateFilter, parse_update_filters
+from .metrics import HomeSeerMetrics, HomeSeerProfiler
+from .registry import (
+    DeviceRecord,
+    HomeSeerRegistry,
+    classify_device,
+    get_interface_name,
+)
+from .scheduler import HomeSeerUpdateScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
-DEVICES_MODEL = {
-    "binary_sensor": [],
-    "cover": [],
-    "light": [],
-    "lock": [],
-    "remote": [],
-    "sensor": [],
-    "scene": [],
-    "switch": [],
-}
-
 
 class HomeSeerBridge:
     """Manages a single connection between HomeSeer and Home Assistant."""
@@ -52,6 +106,7 @@ class HomeSeerBridge:
     def __init__(
         self,
         hass: HomeAssistant,
+        entry_id: str,
         host: str,
         username: str,
         password: str,
@@ -62,28 +117,73 @@ class HomeSeerBridge:
         allowed_event_groups: list,
         forced_covers: list,
         allowed_interfaces: list,
+        options: dict,
     ):
         self._hass = hass
-        self._session = aiohttp_client.async_get_clientsession(self._hass)
-        self.api = HomeSeer(
+        # A dedicated session keeps a pool of keep-alive connections to HomeSeer, so bursts of commands
+        # reuse open connections instead of sharing Home Assistant's pool with every other integration.
+        self._session_options = get_session_options(options)
+        self._session = create_session(*self._session_options)
+        self._host = host
+        self.api = HomeSeerAPI(
             host,
             self._session,
             username=username,
             password=password,
             http_port=http_port,
             ascii_port=ascii_port,
+            connection_callback=self._async_connection_changed,
         )
+        self._connection_state = STATE_CONNECTING
+        self._connected = asyncio.Event()
+        self._listener_task = None
+        self.reconnects = 0
+        self.setup_time = None
         self._namespace = namespace
         self._name_template = name_template
-        self._allowed_event_groups = allowed_event_groups
-        self._forced_covers = forced_covers
-        self._allowed_interfaces = allowed_interfaces
-        self._devices = DEVICES_MODEL
-        self.remotes = []
+        self._default_name_template = (
+            name_template.template.strip() == DEFAULT_NAME_TEMPLATE
+        )
+        self._names = {}
+        self._allowed_event_groups = frozenset(allowed_event_groups)
+        self._forced_covers = frozenset(forced_covers)
+        self._allowed_interfaces = frozenset(allowed_interfaces)
+        self._registry = HomeSeerRegistry()
+        self._events = []
+        self._events_by_group = {}
+        self.remotes = {}
+        self._platforms = {}
+        self._entities = {}
+        self._parent_refs = {}
+        self._device_infos = MappingProxyType({})
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+        self._catalog = None
+        self._catalog_from_snapshot = False
+        self._unsub_reconcile = None
+        self._reconcile_task = None
+        self._sync_lock = asyncio.Lock()
+        self._sync_interval = DEFAULT_SYNC_INTERVAL
+        self._unsub_sync = None
+        self.scheduler = HomeSeerUpdateScheduler(self._hass)
+        self.commands = HomeSeerCommandQueue(self._hass)
+        self._sensor_min_interval = 0
+        self._static_attributes = DEFAULT_STATIC_ATTRIBUTES
+        self._remote_debounce = 0
+        self._optimistic = DEFAULT_OPTIMISTIC
+        self._remote_event_per_ref = DEFAULT_REMOTE_EVENT_PER_REF
+        self._ref_filters = {}
+        self._type_filters = {}
+        self.metrics = None
+        self.update_options(options)
 
     @property
-    def devices(self) -> dict:
-        return self._devices
+    def registry(self) -> HomeSeerRegistry:
+        return self._registry
+
+    @property
+    def events(self) -> list:
+        """Return the HomeSeer events allowed in Home Assistant."""
+        return self._events
 
     @property
     def namespace(self) -> str:
@@ -94,54 +194,485 @@ class HomeSeerBridge:
         return self._name_template
 
     @property
-    def allowed_event_groups(self) -> list:
+    def hub_device_info(self) -> dict:
+        """Return device info for the HomeSeer instance itself."""
+        return {
+            "identifiers": {(DOMAIN, self._namespace)},
+            "name": f"HomeSeer ({self._namespace})",
+            "manufacturer": "HomeSeer",
+        }
+
+    @property
+    def connection_state(self) -> str:
+        """Return the state of the ASCII connection to HomeSeer."""
+        return self._connection_state
+
+    @property
+    def allowed_event_groups(self) -> frozenset:
         return self._allowed_event_groups
 
     @property
-    def forced_covers(self) -> list:
+    def forced_covers(self) -> frozenset:
         return self._forced_covers
 
     @property
-    def allowed_interfaces(self) -> list:
+    def allowed_interfaces(self) -> frozenset:
         return self._allowed_interfaces
 
+    def devices_for_platform(self, platform: str) -> list:
+        """Return the HomeSeer devices assigned to the given Home Assistant platform."""
+        devices = self.api.devices
+        return [devices[ref] for ref in self._registry.refs_for_platform(platform)]
+
+    @property
+    def sensor_min_interval(self) -> float:
+        return self._sensor_min_interval
+
+    @property
+    def static_attributes(self) -> bool:
+        return self._static_attributes
+
+    @property
+    def optimistic(self) -> bool:
+        return self._optimistic
+
+    @property
+    def remote_debounce(self) -> float:
+        return self._remote_debounce
+
+    @property
+    def remote_event_per_ref(self) -> bool:
+        return self._remote_event_per_ref
+
+    def get_update_filter(self, device) -> Optional[UpdateFilter]:
+        """Return the update filter for a device, preferring a filter for its ref over one for its type."""
+        update_filter = self._ref_filters.get(device.ref)
+        if update_filter is None:
+            update_filter = self._type_filters.get(device.device_type_string)
+        return update_filter
+
+    @property
+    def session_options(self) -> tuple:
+        """Return the connection limit and keep-alive timeout the bridge's HTTP session was created with."""
+        return self._session_options
+
+    @property
+    def updates_received(self) -> int:
+        """Return the number of device updates received from HomeSeer."""
+        return self.scheduler.updates_received
+
+    @property
+    def updates_suppressed(self) -> int:
+        """Return the number of received device updates suppressed by update filters."""
+        return self.scheduler.updates_suppressed
+
+    @property
+    def updates_written(self) -> int:
+        """Return the number of state writes made to Home Assistant for device updates."""
+        return self.scheduler.updates_written
+
+    def update_options(self, options: dict) -> None:
+        """Apply options from the config entry (values in milliseconds are stored as seconds)."""
+        self.scheduler.update_window = (
+            options.get(CONF_UPDATE_WINDOW, DEFAULT_UPDATE_WINDOW) / 1000
+        )
+        self._sensor_min_interval = (
+            options.get(CONF_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_MIN_INTERVAL) / 1000
+        )
+        self._static_attributes = options.get(
+            CONF_STATIC_ATTRIBUTES, DEFAULT_STATIC_ATTRIBUTES
+        )
+        self._remote_debounce = (
+            options.get(CONF_REMOTE_DEBOUNCE, DEFAULT_REMOTE_DEBOUNCE) / 1000
+        )
+        self._optimistic = options.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC)
+        self._remote_event_per_ref = options.get(
+            CONF_REMOTE_EVENT_PER_REF, DEFAULT_REMOTE_EVENT_PER_REF
+        )
+        self._ref_filters, self._type_filters = parse_update_filters(
+            options.get(CONF_UPDATE_FILTERS, {})
+        )
+        sync_interval = options.get(CONF_SYNC_INTERVAL, DEFAULT_SYNC_INTERVAL)
+        if sync_interval != self._sync_interval:
+            self._sync_interval = sync_interval
+            if self._unsub_sync is not None:
+                self._async_start_periodic_sync()
+        if not options.get(CONF_METRICS, DEFAULT_METRICS):
+            self.metrics = None
+        elif self.metrics is None:
+            self.metrics = HomeSeerMetrics()
+        self.api.metrics = self.metrics
+        self.scheduler.metrics = self.metrics
+
+    def get_metrics(self) -> dict:
+        """Return a JSON-serializable snapshot of the bridge's counters and (if enabled) collected metrics."""
+        snapshot = {
+            "connection_state": self._connection_state,
+            "reconnects": self.reconnects,
+            "setup_time": self.setup_time,
+            "devices": len(self.api.devices),
+            "updates_received": self.updates_received,
+            "updates_suppressed": self.updates_suppressed,
+            "updates_written": self.updates_written,
+            "commands_sent": self.commands.sent,
+            "commands_superseded": self.commands.superseded,
+            "metrics_enabled": self.metrics is not None,
+        }
+        if self.metrics is not None:
+            snapshot.update(self.metrics.as_dict())
+        return snapshot
+
     async def setup(self) -> bool:
-        """Initialize the HomeSeer API and sort devices."""
-        await self.api.initialize()
+        """
+        Load the HomeSeer device and event catalog and sort devices.
+        The catalog is loaded from the snapshot stored by a previous run when one exists, so that entities can be
+        created without waiting for HomeSeer; the snapshot is reconciled with the live catalog once the bridge starts.
+        Raises ConfigEntryNotReady if there is no snapshot and the catalog cannot be fetched from HomeSeer.
+        """
+        catalog = await self._store.async_load()
+        self._catalog_from_snapshot = catalog is not None
+        if catalog is None:
+            catalog = await self._async_fetch_catalog()
+            if catalog is None:
+                raise ConfigEntryNotReady(
+                    f"Could not retrieve the HomeSeer catalog from {self._host}"
+                )
+            await self._store.async_save(catalog)
+
+        self.api.load_catalog(catalog)
+        self._catalog = catalog
         if not self.api.devices and not self.api.events:
             return False
 
-        for device in self.api.devices.values():
-            platform = self._get_ha_platform_for_homeseer_device(device)
-            if platform is not None:
-                self._devices[platform].append(device)
+        self._index_devices()
+        self._build_device_infos()
+        self._index_events()
+        self._events = self._get_allowed_events()
+
+        self.remotes = {}
+        for device in self.devices_for_platform("remote"):
+            self._add_remote(device)
+
+        return True
 
+    def _index_events(self) -> None:
+        """Index the loaded HomeSeer events by group and name."""
+        self._events_by_group = {}
         for event in self.api.events:
-            if (
-                self.allowed_event_groups
-                and event.group not in self.allowed_event_groups
-            ):
+            self._events_by_group.setdefault(event.group, {})[event.name] = event
+
+    def _get_allowed_events(self) -> list:
+        """Return the HomeSeer events in the allowed event groups (all events if no groups are selected)."""
+        return [
+            event
+            for group, events in self._events_by_group.items()
+            if not self._allowed_event_groups or group in self._allowed_event_groups
+            for event in events.values()
+        ]
+
+    def get_events(self, events: list, group: Optional[str] = None) -> list:
+        """
+        Return the allowed HomeSeer events identified by a list of {"group": ..., "name": ...} dicts,
+        followed by all events in group (if given). Raises HomeAssistantError for unknown or disallowed events.
+        """
+        allowed = self._allowed_event_groups
+        result = []
+        for item in events:
+            event = self._events_by_group.get(item[ATTR_GROUP], {}).get(item[ATTR_NAME])
+            if event is None or (allowed and event.group not in allowed):
+                raise HomeAssistantError(
+                    f"No HomeSeer event {item[ATTR_GROUP]} {item[ATTR_NAME]} for {self._namespace}"
+                )
+            result.append(event)
+
+        if group is not None:
+            if group not in self._events_by_group or (allowed and group not in allowed):
+                raise HomeAssistantError(
+                    f"No HomeSeer event group {group} for {self._namespace}"
+                )
+            result.extend(self._events_by_group[group].values())
+
+        return result
+
+    def _add_remote(self, device) -> None:
+        """Link a remote-type device to Home Assistant events."""
+        self.remotes[device.ref] = HomeSeerRemote(self._hass, device, self)
+        _LOGGER.info(
+            "Added HomeSeer remote-type device: %s %s %s (%s)",
+            device.location2,
+            device.location,
+            device.name,
+            device.ref,
+        )
+
+    @callback
+    def async_setup_platform(
+        self, platform: str, async_add_entities: Callable, entity_factory: Callable
+    ) -> None:
+        """
+        Add the entities for a Home Assistant platform, created by calling entity_factory(device, bridge)
+        (or entity_factory(event, bridge) for scenes). The callbacks are kept so that entities can be added
+        and removed individually when the allowed interfaces, event groups or forced covers change.
+        """
+        self._platforms[platform] = (async_add_entities, entity_factory)
+        self._entities[platform] = {}
+        if platform == "scene":
+            items = {event_key(event): event for event in self._events}
+        else:
+            items = {
+                device.ref: device for device in self.devices_for_platform(platform)
+            }
+        self._async_add_entities(platform, items)
+
+    @callback
+    def _async_add_entities(self, platform: str, items: dict) -> None:
+        """Create and add entities for the given devices or events, keyed by ref or event key."""
+        if platform not in self._platforms:
+            _LOGGER.debug(
+                "Platform %s is not set up, not adding %s HomeSeer entities",
+                platform,
+                len(items),
+            )
+            return
+
+        async_add_entities, entity_factory = self._platforms[platform]
+        entities = self._entities[platform]
+        new_entities = []
+        for key, item in items.items():
+            entity = entity_factory(item, self)
+            entities[key] = entity
+            new_entities.append(entity)
+
+        if new_entities:
+            async_add_entities(new_entities)
+            _LOGGER.info(
+                "Added %s HomeSeer %s entities for %s",
+                len(new_entities),
+                platform,
+                self._namespace,
+            )
+
+    async def _async_remove_entities(self, platform: str, keys: list) -> None:
+        """Remove the entities for the given refs or event keys, including their entity registry entries."""
+        entities = self._entities.get(platform, {})
+        registry = entity_registry.async_get(self._hass)
+        removed = 0
+        for key in keys:
+            entity = entities.pop(key, None)
+            if entity is None:
                 continue
-            self._devices["scene"].append(event)
+            removed += 1
+            # The state is removed before the registry entry, so that an entity recreated for the same
+            # device gets its entity ID back rather than a suffixed one.
+            entity_id = entity.entity_id
+            registry_entry = entity.registry_entry
+            await entity.async_remove(force_remove=True)
+            if registry_entry is not None:
+                registry.async_remove(entity_id)
 
-        for device in self.devices["remote"]:
-            self.remotes.append(HomeSeerRemote(self._hass, device))
+        if removed:
             _LOGGER.info(
-                f"Added HomeSeer remote-type device: "
-                f"{device.location2} {device.location} {device.name } ({device.ref})"
+                "Removed %s HomeSeer %s entities for %s",
+                removed,
+                platform,
+                self._namespace,
             )
 
-        return True
+    async def async_reconfigure(
+        self,
+        allowed_interfaces: list,
+        allowed_event_groups: list,
+        forced_covers: list,
+    ) -> None:
+        """
+        Apply new allowed interfaces, event groups and forced covers using the in-memory catalog.
+        Devices are classified again and only those whose platform changed have their entities removed
+        and/or added; likewise only scenes for events entering or leaving the allowed groups change.
+        """
+        allowed_interfaces = frozenset(allowed_interfaces)
+        allowed_event_groups = frozenset(allowed_event_groups)
+        forced_covers = frozenset(forced_covers)
+        if (
+            allowed_interfaces == self._allowed_interfaces
+            and forced_covers == self._forced_covers
+            and allowed_event_groups == self._allowed_event_groups
+        ):
+            return
 
-    async def start(self) -> None:
-        """Start listening to HomeSeer for device updates."""
-        await self.api.start_listener()
+        self._allowed_interfaces = allowed_interfaces
+        self._forced_covers = forced_covers
+        self._allowed_event_groups = allowed_event_groups
 
-    async def stop(self, *args) -> None:
-        """Stop listening to HomeSeer for device updates."""
-        await self.api.stop_listener()
+        removed = {}
+        added = {}
+        for device in self.api.devices.values():
+            record = self._registry.get(device.ref)
+            platform = classify_device(
+                device,
+                record.interface_name,
+                self._allowed_interfaces,
+                self._forced_covers,
+            )
+            if platform == record.platform:
+                continue
+            if record.platform is not None:
+                removed.setdefault(record.platform, []).append(device.ref)
+            if platform is not None:
+                added.setdefault(platform, {})[device.ref] = device
+                self.get_name(device)
+            self._registry.add(
+                DeviceRecord(
+                    device.ref,
+                    platform,
+                    record.interface_name,
+                    record.device_type_string,
+                )
+            )
+        self._build_device_infos()
+
+        for ref in removed.pop("remote", []):
+            self.remotes.pop(ref).remove()
+        for platform, refs in removed.items():
+            await self._async_remove_entities(platform, refs)
+
+        for device in added.pop("remote", {}).values():
+            self._add_remote(device)
+        for platform, devices in added.items():
+            self._async_add_entities(platform, devices)
+
+        old_events = {event_key(event) for event in self._events}
+        self._events = self._get_allowed_events()
+        new_events = {event_key(event): event for event in self._events}
+        await self._async_remove_entities(
+            "scene", [key for key in old_events if key not in new_events]
+        )
+        self._async_add_entities(
+            "scene",
+            {key: event for key, event in new_events.items() if key not in old_events},
+        )
+
+    def _index_devices(self) -> None:
+        """
+        Classify all HomeSeer devices into the registry in a single pass.
+        Every device is indexed by interface name and device type string;
+        devices that are assigned a platform are also indexed by platform.
+        The registry is rebuilt from scratch, so repeated setups do not duplicate devices.
+        """
+        self._registry.clear()
+
+        for device in self.api.devices.values():
+            self._register_device(device)
+
+    def _register_device(self, device) -> Optional[str]:
+        """Classify a device, add it to the registry and return the platform it was assigned (if any)."""
+        iname = get_interface_name(device)
+        platform = classify_device(
+            device, iname, self._allowed_interfaces, self._forced_covers
+        )
+        self._registry.add(
+            DeviceRecord(device.ref, platform, iname, device.device_type_string)
+        )
+        if platform is not None:
+            self.get_name(device)
+        return platform
+
+    def _build_device_infos(self) -> None:
+        """
+        Build the device info of every parent device with entities, shared by the parent and all of its children.
+        The map is rebuilt only when the catalog or the classification of devices changes.
+        """
+        devices = self.api.devices
+        parent_refs = {}
+        device_infos = {}
+        for ref, device in devices.items():
+            record = self._registry.get(ref)
+            if record is None or record.platform in (None, "remote"):
+                continue
+
+            parent_ref = ref
+            if device.relationship == RELATIONSHIP_CHILD:
+                parent_ref = device.associated_devices[0]
+            parent = devices.get(parent_ref)
+            if parent is None:
+                continue
+
+            parent_refs[ref] = parent_ref
+            if parent_ref not in device_infos:
+                device_infos[parent_ref] = {
+                    "identifiers": {(self._namespace, parent.ref)},
+                    "name": f"{parent.location2} {parent.location} {parent.name}",
+                    "model": parent.device_type_string,
+                    "manufacturer": parent.interface_name,
+                    "via_device": (DOMAIN, self._namespace),
+                }
+
+        self._parent_refs = parent_refs
+        self._device_infos = MappingProxyType(device_infos)
+
+    def export_values(self, interfaces: list, device_types: list) -> dict:
+        """
+        Return the ref, value, status, last change (ISO 8601), device type string and interface name of every
+        loaded device as a dict of equal-length lists. Devices can be limited to any of the given interface names and/or any of
+        the given device type strings; the registry indexes are used, so filtered exports only visit matching devices.
+        """
+        devices = self.api.devices
+        if interfaces:
+            refs = [
+                ref
+                for iname in interfaces
+                for ref in self._registry.refs_for_interface(iname)
+            ]
+            if device_types:
+                refs = [
+                    ref
+                    for ref in refs
+                    if self._registry.get(ref).device_type_string in device_types
+                ]
+        elif device_types:
+            refs = [
+                ref
+                for device_type in device_types
+                for ref in self._registry.refs_for_type(device_type)
+            ]
+        else:
+            refs = list(devices)
+
+        columns = {
+            ATTR_REF: [],
+            ATTR_VALUE: [],
+            ATTR_STATUS: [],
+            ATTR_LAST_CHANGE: [],
+            ATTR_DEVICE_TYPE_STRING: [],
+            ATTR_INTERFACE_NAME: [],
+        }
+        for ref in refs:
+            device = devices[ref]
+            columns[ATTR_REF].append(ref)
+            columns[ATTR_VALUE].append(device.value)
+            columns[ATTR_STATUS].append(device.status)
+            dt = get_datetime_from_last_change(device.last_change)
+            columns[ATTR_LAST_CHANGE].append(
+                dt.astimezone().isoformat() if dt is not None else None
+            )
+            columns[ATTR_DEVICE_TYPE_STRING].append(device.device_type_string)
+            columns[ATTR_INTERFACE_NAME].append(get_interface_name(device))
+        return columns
 
-    def _get_ha_platform_for_homeseer_device(
+    def get_device_info(self, ref: int) -> Optional[dict]:
+        """Return the device info of the parent device of the given ref."""
+        return self._device_infos.get(self._parent_refs.get(ref))
+
+    @callback
+    def async_register_devices(self, config_entry_id: str) -> None:
+        """Register the HomeSeer instance and all parent devices in the device registry in one pass."""
+        registry = device_registry.async_get(self._hass)
+        registry.async_get_or_create(
+            config_entry_id=config_entry_id, **self.hub_device_info
+        )
+        for device_info in self._device_infos.values():
+            registry.async_get_or_create(config_entry_id=config_entry_id, **device_info)
+
+    def get_name(
         self,
         device: Union[
             HomeSeerStatusDevice,
@@ -149,63 +680,344 @@ class HomeSeerBridge:
             HomeSeerDimmableDevice,
             HomeSeerLockableDevice,
         ],
-    ) -> Optional[str]:
+    ) -> str:
         """
-        Return the correct platform for the given device.
-        This method ensures that a HomeSeer device will only ever be represented in one platform,
-        and filters out devices as required.
+        Return the entity name for the given device.
+        Names are cached by device ref and only rendered again when the name, location or location2 of the device
+        changes; the default name template is formatted directly without rendering it through Jinja.
         """
-        # Filter out devices from interfaces not selected during the Config Flow.
-        iname = (
-            device.interface_name
-            if device.interface_name is not None
-            else DEFAULT_INTERFACE_NAME
-        )
-        if iname not in self.allowed_interfaces:
-            _LOGGER.debug(
-                f"Device ref {device.ref} is from disabled interface {iname}, "
-                f"not creating an entity for this device"
+        key = (device.name, device.location, device.location2)
+        cached = self._names.get(device.ref)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if self._default_name_template:
+            name = f"{device.location2} {device.location} {device.name}".strip()
+        else:
+            name = self._name_template.async_render(device=device).strip()
+
+        self._names[device.ref] = (key, name)
+        return name
+
+    async def start(self) -> None:
+        """
+        Start listening to HomeSeer for device updates.
+        The ASCII listener connects in the background and reconnects with backoff for as long as the bridge runs;
+        entities are unavailable while it is not connected.
+        """
+        self._connection_state = STATE_CONNECTING
+        self._listener_task = self._hass.async_create_task(self.api.start_listener())
+        if self._catalog_from_snapshot:
+            self._catalog_from_snapshot = False
+            self._async_schedule_reconcile()
+        self._async_start_periodic_sync()
+
+    async def stop(self, *args) -> None:
+        """Stop listening to HomeSeer for device updates."""
+        self._connection_state = STATE_STOPPED
+        # A listener that has not finished starting would otherwise connect after being stopped.
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            self._listener_task = None
+        if self._unsub_reconcile is not None:
+            self._unsub_reconcile()
+            self._unsub_reconcile = None
+        if self._reconcile_task is not None:
+            self._reconcile_task.cancel()
+            self._reconcile_task = None
+        await self.api.stop_listener()
+        self.scheduler.async_stop()
+        self.commands.async_stop()
+        if self._unsub_sync is not None:
+            self._unsub_sync()
+            self._unsub_sync = None
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close the HTTP connections to HomeSeer."""
+        await self._session.close()
+
+    @callback
+    def _async_connection_changed(self, connected: bool) -> None:
+        """Track the state of the ASCII connection, called by the API on every connect and disconnect."""
+        if connected:
+            if self._connection_state == STATE_RECONNECTING:
+                self.reconnects += 1
+            self._connection_state = STATE_CONNECTED
+            self._connected.set()
+            _LOGGER.info("Connected to HomeSeer ASCII at %s", self._host)
+            return
+
+        self._connected.clear()
+        if self._connection_state != STATE_STOPPED:
+            self._connection_state = STATE_RECONNECTING
+            _LOGGER.warning(
+                "Lost ASCII connection to HomeSeer at %s, reconnecting", self._host
             )
-            return None
 
-        # Force certain devices selected during the Config Flow to be covers.
-        if device.ref in self.forced_covers:
-            _LOGGER.debug(
-                f"Device ref {device.ref} is forced as a cover, "
-                f"creating a cover entity for this device"
+    async def async_profile(self, duration: float, top: int) -> dict:
+        """
+        Sample the update stream for the given number of seconds and return the top refs
+        by update rate, state write cost and state attribute bytes written.
+        """
+        if self.api.profiler is not None:
+            raise HomeAssistantError(
+                f"HomeSeer devices for {self._namespace} are already being profiled"
             )
-            return "cover"
 
-        # Some devices should be represented as a Home Assistant platform other than what the HS API data suggests
-        # These devices can be "forced" into other platforms by adding their "device_type_string" to the
-        # homeseer_quirks.py file.
+        profiler = HomeSeerProfiler()
+        self.api.profiler = profiler
+        self.scheduler.profiler = profiler
         try:
-            return HOMESEER_QUIRKS[device.device_type_string]
-        except KeyError:
-            _LOGGER.debug(
-                f"No platform quirk found for device type string "
-                f"{device.device_type_string}, "
-                f"automatically assigning a platform for device ref {device.ref}"
+            await asyncio.sleep(duration)
+        finally:
+            self.api.profiler = None
+            self.scheduler.profiler = None
+
+        return profiler.results(duration, top, self.api.devices)
+
+    async def _async_fetch_catalog(self) -> Optional[dict]:
+        """Fetch the live catalog from HomeSeer, recording the time taken when metrics are enabled."""
+        start = monotonic()
+        catalog = await self.api.fetch_catalog()
+        if catalog is not None and self.metrics is not None:
+            self.metrics.catalog_load_time = round(monotonic() - start, 3)
+        return catalog
+
+    @callback
+    def _async_schedule_reconcile(self, *args) -> None:
+        """Start reconciling the catalog in a task that is cancelled when the bridge is stopped."""
+        self._unsub_reconcile = None
+        self._reconcile_task = self._hass.async_create_task(
+            self._async_reconcile_catalog()
+        )
+
+    async def _async_reconcile_catalog(self) -> None:
+        """
+        Fetch the live catalog from HomeSeer and reconcile the devices loaded from the stored snapshot with it.
+        Devices that were added, removed or changed since the snapshot are applied incrementally and the
+        live catalog is stored as the new snapshot; the fetch waits for the ASCII connection and is retried
+        periodically until HomeSeer responds.
+        """
+        await self._connected.wait()
+        try:
+            catalog = await asyncio.wait_for(
+                self._async_fetch_catalog(), CATALOG_TIMEOUT
             )
+        except asyncio.TimeoutError:
+            catalog = None
+
+        # wait_for does not re-raise the cancellation from stop() if the fetch completed at the same time.
+        if self._connection_state == STATE_STOPPED:
+            return
 
-        # Return the platform for the device based on the libhomeseer device type
-        if type(device) == HomeSeerSwitchableDevice:
-            return "switch"
-        elif type(device) == HomeSeerDimmableDevice:
-            return "light"
-        elif type(device) == HomeSeerLockableDevice:
-            return "lock"
-        elif type(device) == HomeSeerStatusDevice:
-            return "sensor"
+        if catalog is None:
+            _LOGGER.warning(
+                "Could not retrieve the HomeSeer catalog from %s, retrying in %s seconds",
+                self._host,
+                CATALOG_RETRY_INTERVAL,
+            )
+            self._unsub_reconcile = async_call_later(
+                self._hass, CATALOG_RETRY_INTERVAL, self._async_schedule_reconcile
+            )
+            return
+
+        async with self._sync_lock:
+            changes = await self._async_apply_devices(
+                catalog[CATALOG_DEVICES], catalog[CATALOG_CONTROLS]
+            )
+            events_changed = catalog[CATALOG_EVENTS] != self._catalog[CATALOG_EVENTS]
+            self._catalog = catalog
+            await self._store.async_save(catalog)
 
         _LOGGER.debug(
-            f"No valid platform detected for device ref {device.ref} (type: {type(device)})"
+            "Reconciled HomeSeer catalog snapshot for %s: %s", self._host, changes
         )
-        return None
+        if events_changed:
+            _LOGGER.warning(
+                "HomeSeer events for %s have changed since the last snapshot; "
+                "reload the HomeSeer integration to apply these changes",
+                self._host,
+            )
+
+    @callback
+    def _async_start_periodic_sync(self) -> None:
+        """(Re)start the periodic catalog sync at the configured interval (in minutes, 0 disables it)."""
+        if self._unsub_sync is not None:
+            self._unsub_sync()
+            self._unsub_sync = None
+        if self._sync_interval:
+            self._unsub_sync = async_track_time_interval(
+                self._hass,
+                self._async_periodic_sync,
+                timedelta(minutes=self._sync_interval),
+            )
+
+    async def _async_periodic_sync(self, *args) -> None:
+        """Sync the catalog on a schedule, skipping runs while HomeSeer is not connected."""
+        if self._connection_state == STATE_CONNECTED:
+            await self.async_sync_catalog()
+
+    async def async_sync_catalog(self) -> Optional[dict]:
+        """
+        Fetch the HomeSeer device list with a single request and apply only the differences to the loaded devices.
+        Devices are compared by a fingerprint of their name, location, location2, type and interface;
+        control pairs are only requested for devices that are new. Returns the number of devices added,
+        removed, changed and renamed, or None if no catalog is loaded or HomeSeer could not be reached.
+        """
+        if self._catalog is None:
+            return None
+
+        async with self._sync_lock:
+            raw_devices = await self.api.fetch_devices()
+            if raw_devices is None:
+                return None
+
+            controls = self._catalog[CATALOG_CONTROLS]
+            new_refs = [
+                raw_device["ref"]
+                for raw_device in raw_devices
+                if self.api.get_fingerprint(int(raw_device["ref"])) is None
+            ]
+            if new_refs:
+                new_controls = await self.api.fetch_controls(new_refs)
+                if new_controls is None:
+                    return None
+                controls = {**controls, **new_controls}
+
+            changes = await self._async_apply_devices(raw_devices, controls)
+
+            live_refs = {str(raw_device["ref"]) for raw_device in raw_devices}
+            self._catalog = {
+                **self._catalog,
+                CATALOG_DEVICES: raw_devices,
+                CATALOG_CONTROLS: {
+                    ref: pairs for ref, pairs in controls.items() if ref in live_refs
+                },
+            }
+            if any(changes.values()):
+                await self._store.async_save(self._catalog)
+
+        _LOGGER.info("Synced HomeSeer catalog for %s: %s", self._host, changes)
+        return changes
+
+    async def _async_apply_devices(self, raw_devices: list, controls: dict) -> dict:
+        """
+        Apply a live device list to the loaded devices, adding, removing or renaming only the entities that changed.
+        Devices whose type, interface or control pairs changed are recreated, as they may now belong to
+        another platform; controls must contain the control pairs of every device that is not loaded yet.
+        """
+        old_controls = self._catalog[CATALOG_CONTROLS]
+        live = {int(raw_device["ref"]): raw_device for raw_device in raw_devices}
+        removed = [ref for ref in self.api.devices if ref not in live]
+        added = []
+        changed = []
+        renamed = []
+
+        for ref, raw_device in live.items():
+            old = self.api.get_fingerprint(ref)
+            new = get_fingerprint(raw_device)
+            if old is None:
+                added.append(ref)
+            elif (
+                old.device_type_string != new.device_type_string
+                or old.interface_name != new.interface_name
+                or old_controls.get(str(ref)) != controls.get(str(ref))
+            ):
+                changed.append(ref)
+            elif old != new:
+                renamed.append(ref)
+
+        await self._async_remove_devices(removed + changed)
+
+        for ref in added + changed:
+            self.api.add_device(live[ref], controls.get(str(ref), []))
+        self._async_add_devices(added + changed)
+
+        for ref in renamed:
+            record = self._registry.get(ref)
+            entity = self._entities.get(record.platform, {}).get(ref)
+            if entity is not None:
+                entity.async_reset_attributes()
+            self.api.update_device(live[ref])
+
+        if removed or added or changed or renamed:
+            self._build_device_infos()
+
+        return {
+            "added": len(added),
+            "removed": len(removed),
+            "changed": len(changed),
+            "renamed": len(renamed),
+        }
+
+    async def _async_remove_devices(self, refs: list) -> None:
+        """Remove loaded devices along with their entities or remotes."""
+        by_platform = {}
+        for ref in refs:
+            record = self._registry.remove(ref)
+            if record is not None and record.platform is not None:
+                by_platform.setdefault(record.platform, []).append(ref)
+            self._names.pop(ref, None)
+
+        for ref in by_platform.pop("remote", []):
+            self.remotes.pop(ref).remove()
+        for platform, platform_refs in by_platform.items():
+            await self._async_remove_entities(platform, platform_refs)
+
+        for ref in refs:
+            self.api.remove_device(ref)
+
+    @callback
+    def _async_add_devices(self, refs: list) -> None:
+        """Classify loaded devices that have no entities yet and add their entities or remotes."""
+        by_platform = {}
+        for ref in refs:
+            device = self.api.devices[ref]
+            platform = self._register_device(device)
+            if platform == "remote":
+                self._add_remote(device)
+            elif platform is not None:
+                by_platform.setdefault(platform, {})[ref] = device
+
+        for platform, devices in by_platform.items():
+            self._async_add_entities(platform, devices)
+
+
+def get_session_options(options: dict) -> tuple:
+    """Return the connection limit and keep-alive timeout for the bridge's HTTP session from the options."""
+    return (
+        options.get(CONF_CONNECTION_LIMIT, DEFAULT_CONNECTION_LIMIT),
+        options.get(CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT),
+    )
+
+
+def event_key(event) -> tuple:
+    """Return the key identifying a HomeSeer event (events have no ref)."""
+    return event.group, event.name
 
 
 class HomeSeerEntity(Entity):
-    """Base representation for all HomeSeer entities."""
+    """
+    Base representation for all HomeSeer entities.
+    Entities hold only the device ref, the bridge and cached derived fields, in slots; the device itself is
+    resolved from the bridge's ref-indexed device table. Entity has no slots, so the attributes set by Home
+    Assistant still live in each instance's __dict__, which the integration's fields are kept out of.
+    """
+
+    __slots__ = (
+        "_ref",
+        "_bridge",
+        "_attributes_key",
+        "_attributes",
+        "_assumed_state",
+        "_command_sent",
+        "_unsub_command_timeout",
+    )
+
+    # Entity defines __eq__ without __hash__, which makes entities unhashable; the update scheduler
+    # keys its pending writes by entity, so entities are hashed by identity like plain objects.
+    __hash__ = object.__hash__
 
     def __init__(
         self,
@@ -217,8 +1029,25 @@ class HomeSeerEntity(Entity):
         ],
         bridge: HomeSeerBridge,
     ):
-        self._device = device
+        self._ref = device.ref
         self._bridge = bridge
+        self._attributes_key = None
+        self._attributes = None
+        self._assumed_state = None
+        self._command_sent = None
+        self._unsub_command_timeout = None
+
+    @property
+    def _device(
+        self,
+    ) -> Union[
+        HomeSeerStatusDevice,
+        HomeSeerSwitchableDevice,
+        HomeSeerDimmableDevice,
+        HomeSeerLockableDevice,
+    ]:
+        """Return the HomeSeer device of the entity from the bridge's device table."""
+        return self._bridge.api.devices[self._ref]
 
     @property
     def available(self) -> bool:
@@ -227,61 +1056,182 @@ class HomeSeerEntity(Entity):
 
     @property
     def device_state_attributes(self) -> dict:
-        """Return a dictionary of state attributes."""
-        dt = get_datetime_from_last_change(self._device.last_change)
-        attr = {
-            ATTR_REF: self._device.ref,
-            ATTR_LOCATION2: self._device.location2,
-            ATTR_LOCATION: self._device.location,
-            ATTR_NAME: self._device.name,
-            ATTR_DEVICE_TYPE_STRING: self._device.device_type_string,
-            ATTR_VALUE: self._device.value,
-            ATTR_STATUS: self._device.status,
-            ATTR_LAST_CHANGE: (
-                dt.astimezone().isoformat("T", "seconds") if dt is not None else None
-            ),
-        }
+        """
+        Return a dictionary of state attributes.
+        The dictionary is cached and only rebuilt when the value, status or last change of the device differ.
+        """
+        device = self._device
+        static_attributes = self._bridge.static_attributes
+        key = (device.value, device.status, device.last_change, static_attributes)
+        if key == self._attributes_key:
+            return self._attributes
+
+        dt = get_datetime_from_last_change(device.last_change)
+        attr = {ATTR_REF: device.ref}
+        if static_attributes:
+            attr[ATTR_LOCATION2] = device.location2
+            attr[ATTR_LOCATION] = device.location
+            attr[ATTR_NAME] = device.name
+            attr[ATTR_DEVICE_TYPE_STRING] = device.device_type_string
+        attr[ATTR_VALUE] = key[0]
+        attr[ATTR_STATUS] = key[1]
+        attr[ATTR_LAST_CHANGE] = (
+            dt.astimezone().isoformat("T", "seconds") if dt is not None else None
+        )
+
+        self._attributes_key = key
+        self._attributes = attr
         return attr
 
+    @property
+    def ref(self) -> int:
+        """Return the HomeSeer device ref of the device."""
+        return self._ref
+
     @property
     def unique_id(self) -> str:
         """Return a unique ID for the device."""
-        return f"{self._bridge.namespace}-{self._device.ref}"
+        return f"{self._bridge.namespace}-{self._ref}"
 
     @property
     def name(self) -> str:
         """Return the name of the device rendered from the user-supplied template."""
-        return self._bridge.name_template.async_render(device=self._device).strip()
+        return self._bridge.get_name(self._device)
 
     @property
     def device_info(self) -> dict:
         """Return device info for the parent device."""
-        parent_ref = self._device.ref
-        if self._device.relationship == RELATIONSHIP_CHILD:
-            parent_ref = self._device.associated_devices[0]
-
-        parent = self._bridge.api.devices[parent_ref]
-
-        return {
-            "identifiers": {(self._bridge.namespace, parent.ref)},
-            "name": f"{parent.location2} {parent.location} {parent.name}",
-            "model": parent.device_type_string,
-            "manufacturer": parent.interface_name,
-            "via_device": (DOMAIN, self._bridge.namespace),
-        }
+        return self._bridge.get_device_info(self._ref)
 
     @property
     def should_poll(self) -> bool:
         """No polling necessary for HomeSeer entities."""
         return False
 
+    @property
+    def min_update_interval(self) -> float:
+        """Return the minimum number of seconds between state writes for the entity."""
+        return 0
+
     async def async_added_to_hass(self) -> None:
         """Register update callback."""
-        self._device.register_update_callback(self.async_schedule_update_ha_state)
+        self._device.register_update_callback(self._update_callback)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister update callback and drop any pending state write."""
+        device = self._bridge.api.devices.get(self._ref)
+        if device is not None:
+            device.register_update_callback(None)
+        self._bridge.scheduler.async_cancel(self)
+        self._async_clear_assumed_state()
+
+    @callback
+    def async_reset_attributes(self) -> None:
+        """Drop the cached state attributes (e.g. before the device's name or location changes)."""
+        self._attributes_key = None
+
+    def _assumed(self, key: str, actual: Any) -> Any:
+        """Return the state assumed for key while an optimistic command is pending, otherwise the actual state."""
+        if self._assumed_state is None:
+            return actual
+        return self._assumed_state.get(key, actual)
+
+    async def _async_command(self, method: Callable, *args, **assumed_state) -> None:
+        """
+        Send a command (a device method and its arguments) to the device through the bridge's command queue,
+        where a newer command for the device replaces this one if it has not been sent yet.
+        In optimistic mode the assumed state (property name -> value) is written immediately and kept until HomeSeer
+        reports an update for the device after the command was sent, or is rolled back if no update arrives within
+        the timeout or the command is not sent.
+        """
+        command = partial(method, *args)
+        if not self._bridge.optimistic:
+            await self._bridge.commands.async_send(self._ref, command)
+            return
+
+        async def send() -> None:
+            # Only updates that follow the start of this command acknowledge it; the echo of an earlier
+            # command still in flight for the device must not replace the state assumed for this one.
+            if self._assumed_state is assumed_state:
+                self._command_sent = monotonic()
+            await command()
+
+        self._async_clear_assumed_state()
+        self._assumed_state = assumed_state
+        self._unsub_command_timeout = async_call_later(
+            self.hass, OPTIMISTIC_TIMEOUT, self._async_command_timeout
+        )
+        self.async_write_ha_state()
+        try:
+            sent = await self._bridge.commands.async_send(self._ref, send)
+        except Exception:
+            self._async_abandon_command(assumed_state)
+            raise
+        if not sent:
+            # Replaced in the queue by a command for the device from elsewhere (e.g. a service call).
+            self._async_abandon_command(assumed_state)
+
+    @callback
+    def _async_abandon_command(self, assumed_state: dict) -> None:
+        """Roll back to the actual state if assumed_state still belongs to the latest command."""
+        if self._assumed_state is assumed_state:
+            self._async_clear_assumed_state()
+            self.async_write_ha_state()
+
+    @callback
+    def _async_clear_assumed_state(self) -> None:
+        """Drop the assumed state of a pending optimistic command."""
+        self._assumed_state = None
+        self._command_sent = None
+        if self._unsub_command_timeout is not None:
+            self._unsub_command_timeout()
+            self._unsub_command_timeout = None
+
+    @callback
+    def _async_command_timeout(self, *args) -> None:
+        """Roll back to the device's actual state if HomeSeer did not report an update in time."""
+        self._unsub_command_timeout = None
+        _LOGGER.debug(
+            "No update from HomeSeer for device ref %s within %s seconds of a command, rolling back",
+            self._ref,
+            OPTIMISTIC_TIMEOUT,
+        )
+        if self._bridge.metrics is not None:
+            self._bridge.metrics.ack_timeouts += 1
+        self._async_clear_assumed_state()
+        self.async_write_ha_state()
+
+    @callback
+    def _update_callback(self) -> None:
+        """Schedule a state write through the bridge's update scheduler."""
+        if self._command_sent is not None and not self._bridge.api.connection_update:
+            # The device update acknowledges the sent command; its actual state replaces the assumed one.
+            if self._bridge.metrics is not None:
+                self._bridge.metrics.record_ack(
+                    self._ref, monotonic() - self._command_sent
+                )
+            self._async_clear_assumed_state()
+        self._bridge.scheduler.async_schedule(self)
 
 
 class HomeSeerRemote:
-    """Link remote-type devices that should fire events rather than create entities to Home Assistant."""
+    """
+    Link remote-type devices that should fire events rather than create entities to Home Assistant.
+    Every update fires homeseer_event; if enabled in the options, an event type unique to the remote
+    (homeseer_event_<namespace>_<ref>) is fired as well, so that its listeners are not woken by other remotes.
+    Repeated reports of the same value within the debounce interval are dropped.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_ref",
+        "_bridge",
+        "_event",
+        "_ref_event",
+        "_central_scene",
+        "_last_value",
+        "_last_fired",
+    )
 
     def __init__(
         self,
@@ -292,15 +1242,52 @@ class HomeSeerRemote:
             HomeSeerDimmableDevice,
             HomeSeerLockableDevice,
         ],
+        bridge: HomeSeerBridge,
     ) -> None:
         self._hass = hass
-        self._device = device
-        self._device.register_update_callback(
+        self._ref = device.ref
+        self._bridge = bridge
+        device.register_update_callback(
             self.update_callback, suppress_on_connection=True
         )
         self._event = f"homeseer_{CONF_EVENT}"
+        self._ref_event = f"{self._event}_{bridge.namespace}_{device.ref}"
+        self._central_scene = device.device_type_string == DEVICE_ZWAVE_CENTRAL_SCENE
+        self._last_value = None
+        self._last_fired = 0
 
+    def remove(self) -> None:
+        """Stop firing events for the device."""
+        device = self._bridge.api.devices.get(self._ref)
+        if device is not None:
+            device.register_update_callback(None)
+
+    @callback
     def update_callback(self):
-        """Fire the event."""
-        data = {CONF_ID: self._device.ref, CONF_EVENT: self._device.value}
+        """Fire the event, unless it repeats the last value within the debounce interval."""
+        device = self._bridge.api.devices[self._ref]
+        value = device.value
+        now = monotonic()
+        if (
+            value == self._last_value
+            and now - self._last_fired < self._bridge.remote_debounce
+        ):
+            return
+        self._last_value = value
+        self._last_fired = now
+
+        data = {
+            CONF_ID: self._ref,
+            CONF_EVENT: value,
+            CONF_NAMESPACE: self._bridge.namespace,
+            ATTR_STATUS: device.status,
+        }
+        if self._central_scene:
+            data[ATTR_SCENE] = value // CENTRAL_SCENE_DIVISOR
+            data[ATTR_KEY_PRESS] = CENTRAL_SCENE_KEY_PRESSES.get(
+                value % CENTRAL_SCENE_DIVISOR
+            )
+
         self._hass.bus.async_fire(self._event, data, EventOrigin.remote)
+        if self._bridge.remote_event_per_ref:
+            self._hass.bus.async_fire(self._ref_event, data, EventOrigin.remote)
@@ -16,18 +16,8 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up HomeSeer light-type devices."""
-    light_entities = []
-    bridge = hass.data[DOMAIN]
-
-    for device in bridge.devices["light"]:
-        entity = HomeSeerLight(device, bridge)
-        light_entities.append(entity)
-        _LOGGER.info(
-            f"Added HomeSeer light-type device: {entity.name} ({entity.device_state_attributes})"
-        )
-
-    if light_entities:
-        async_add_entities(light_entities)
+    bridge = hass.data[DOMAIN][config_entry.entry_id]
+    bridge.async_setup_platform("light", async_add_entities, HomeSeerLight)
 
 
 class HomeSeerLight(HomeSeerEntity, LightEntity):
@@ -43,20 +33,22 @@ class HomeSeerLight(HomeSeerEntity, LightEntity):
         """Return the brightness of the light."""
         bri = self._device.dim_percent * 255
         if bri > 255:
-            return 255
-        return bri
+            bri = 255
+        return self._assumed("brightness", bri)
 
     @property
     def is_on(self):
         """Return true if device is on."""
-        return self._device.is_on
+        return self._assumed("is_on", self._device.is_on)
 
     async def async_turn_on(self, **kwargs):
         """Turn the light on."""
         brightness = kwargs.get(ATTR_BRIGHTNESS, 255)
         percent = int(brightness / 255 * 100)
-        await self._device.dim(percent)
+        await self._async_command(
+            self._device.dim, percent, is_on=True, brightness=brightness
+        )
 
     async def async_turn_off(self, **kwargs):
         """Turn the light off."""
-        await self._device.off()
+        await self._async_command(self._device.off, is_on=False)
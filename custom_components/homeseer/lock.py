@@ -12,18 +12,8 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up HomeSeer lock-type devices."""
-    lock_entities = []
-    bridge = hass.data[DOMAIN]
-
-    for device in bridge.devices["lock"]:
-        entity = HomeSeerLock(device, bridge)
-        lock_entities.append(entity)
-        _LOGGER.info(
-            f"Added HomeSeer lock-type device: {entity.name} ({entity.device_state_attributes})"
-        )
-
-    if lock_entities:
-        async_add_entities(lock_entities)
+    bridge = hass.data[DOMAIN][config_entry.entry_id]
+    bridge.async_setup_platform("lock", async_add_entities, HomeSeerLock)
 
 
 class HomeSeerLock(HomeSeerEntity, LockEntity):
@@ -32,10 +22,10 @@ class HomeSeerLock(HomeSeerEntity, LockEntity):
     @property
     def is_locked(self):
         """Return true if device is locked."""
-        return self._device.is_locked
+        return self._assumed("is_locked", self._device.is_locked)
 
     async def async_lock(self, **kwargs):
-        await self._device.lock()
+        await self._async_command(self._device.lock, is_locked=True)
 
     async def async_unlock(self, **kwargs):
-        await self._device.unlock()
+        await self._async_command(self._device.unlock, is_locked=False)
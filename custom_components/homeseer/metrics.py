@@ -0,0 +1,164 @@
+"""Opt-in metrics collected on the hot paths of a HomeSeer bridge."""
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Optional
+
+# Upper bounds (in seconds) of the latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in seconds."""
+
+    __slots__ = ("_counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Return the mean duration in seconds, or None if nothing has been recorded."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def record(self, elapsed: float) -> None:
+        """Record a single duration in seconds."""
+        self._counts[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def as_dict(self) -> dict:
+        """Return the histogram as a JSON-serializable dict."""
+        buckets = {
+            f"le_{bound}": count for bound, count in zip(LATENCY_BUCKETS, self._counts)
+        }
+        buckets["inf"] = self._counts[-1]
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 6) if self.count else None,
+            "max": round(self.max, 6),
+            "buckets": buckets,
+        }
+
+
+class HomeSeerMetrics:
+    """
+    Metrics for a single HomeSeer bridge.
+    The bridge only creates a collector when metrics are enabled in the options;
+    every hot path checks for None first, so disabled metrics cost a single comparison.
+    """
+
+    def __init__(self) -> None:
+        self.updates_by_type = Counter()
+        self.update_latency = LatencyHistogram()
+        self.dispatch_latency = LatencyHistogram()
+        self.command_latency = LatencyHistogram()
+        self.request_latency = LatencyHistogram()
+        self.ack_latency = LatencyHistogram()
+        self.ack_latency_by_ref = {}
+        self.ack_timeouts = 0
+        self.catalog_load_time = None
+
+    def record_update(self, device_type_string: Optional[str], elapsed: float) -> None:
+        """Record an ASCII device change and the time taken to refresh the device's data."""
+        self.updates_by_type[device_type_string] += 1
+        self.update_latency.record(elapsed)
+
+    def record_ack(self, ref: int, elapsed: float) -> None:
+        """Record the time between an optimistic command to a device and HomeSeer reporting its update."""
+        self.ack_latency.record(elapsed)
+        histogram = self.ack_latency_by_ref.get(ref)
+        if histogram is None:
+            histogram = self.ack_latency_by_ref[ref] = LatencyHistogram()
+        histogram.record(elapsed)
+
+    def record_request(self, request: Optional[str], elapsed: float) -> None:
+        """Record the duration of a HomeSeer JSON request, keeping device commands separate."""
+        if request == "controldevicebyvalue":
+            self.command_latency.record(elapsed)
+        else:
+            self.request_latency.record(elapsed)
+
+    def as_dict(self) -> dict:
+        """Return all metrics as a JSON-serializable dict."""
+        return {
+            "updates_by_type": {
+                str(device_type): count
+                for device_type, count in self.updates_by_type.most_common()
+            },
+            "update_latency": self.update_latency.as_dict(),
+            "dispatch_latency": self.dispatch_latency.as_dict(),
+            "command_latency": self.command_latency.as_dict(),
+            "request_latency": self.request_latency.as_dict(),
+            "ack_latency": self.ack_latency.as_dict(),
+            "ack_latency_by_ref": {
+                str(ref): {
+                    "count": histogram.count,
+                    "mean": round(histogram.mean, 6),
+                    "max": round(histogram.max, 6),
+                }
+                for ref, histogram in self.ack_latency_by_ref.items()
+            },
+            "ack_timeouts": self.ack_timeouts,
+            "catalog_load_time": self.catalog_load_time,
+        }
+
+
+class HomeSeerProfiler:
+    """
+    Samples the HomeSeer update stream per device ref for a fixed window, recording update counts,
+    time spent writing state and the size of the state attributes written.
+    """
+
+    def __init__(self) -> None:
+        self.updates = Counter()
+        self.writes = Counter()
+        self.write_time = Counter()
+        self.attribute_bytes = Counter()
+
+    def record_update(self, ref: int) -> None:
+        """Record an ASCII device change for the given ref."""
+        self.updates[ref] += 1
+
+    def record_write(self, ref: int, elapsed: float, attribute_bytes: int) -> None:
+        """Record a state write for the given ref."""
+        self.writes[ref] += 1
+        self.write_time[ref] += elapsed
+        self.attribute_bytes[ref] += attribute_bytes
+
+    def results(self, duration: float, top: int, devices: dict) -> dict:
+        """Return the top refs by update rate, state write cost and attribute bytes written."""
+
+        def describe(ref: int) -> dict:
+            device = devices.get(ref)
+            return {
+                "ref": ref,
+                "device_type_string": (
+                    device.device_type_string if device is not None else None
+                ),
+                "updates": self.updates[ref],
+                "updates_per_minute": round(self.updates[ref] * 60 / duration, 2),
+                "writes": self.writes[ref],
+                "write_time_ms": round(self.write_time[ref] * 1000, 3),
+                "attribute_bytes": self.attribute_bytes[ref],
+            }
+
+        return {
+            "duration": duration,
+            "by_update_rate": [
+                describe(ref) for ref, _ in self.updates.most_common(top)
+            ],
+            "by_write_cost": [
+                describe(ref) for ref, _ in self.write_time.most_common(top)
+            ],
+            "by_attribute_bytes": [
+                describe(ref) for ref, _ in self.attribute_bytes.most_common(top)
+            ],
+        }
@@ -0,0 +1,179 @@
+"""Per-bridge registry of HomeSeer devices and the Home Assistant platforms they are assigned to."""
+
+from libhomeseer import (
+    HomeSeerStatusDevice,
+    HomeSeerSwitchableDevice,
+    HomeSeerLockableDevice,
+    HomeSeerDimmableDevice,
+)
+
+import logging
+from typing import Optional, Union
+
+from .const import DEFAULT_INTERFACE_NAME
+from .homeseer_quirks import HOMESEER_QUIRKS
+
+_LOGGER = logging.getLogger(__name__)
+
+PLATFORM_FOR_DEVICE_CLASS = {
+    HomeSeerSwitchableDevice: "switch",
+    HomeSeerDimmableDevice: "light",
+    HomeSeerLockableDevice: "lock",
+    HomeSeerStatusDevice: "sensor",
+}
+
+
+class DeviceRecord:
+    """Compact record of how a single HomeSeer device has been classified."""
+
+    __slots__ = ("ref", "platform", "interface_name", "device_type_string")
+
+    def __init__(
+        self,
+        ref: int,
+        platform: Optional[str],
+        interface_name: str,
+        device_type_string: Optional[str],
+    ) -> None:
+        self.ref = ref
+        self.platform = platform
+        self.interface_name = interface_name
+        self.device_type_string = device_type_string
+
+
+class HomeSeerRegistry:
+    """
+    Ref-keyed registry of DeviceRecords with indexes by platform, interface name and device type string.
+    Indexes are dicts used as insertion-ordered sets, so adding and removing a device is O(1)
+    and rebuilding the registry for a catalog of n devices is O(n).
+    """
+
+    def __init__(self) -> None:
+        self._records = {}
+        self._by_platform = {}
+        self._by_interface = {}
+        self._by_type = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, ref: int) -> bool:
+        return ref in self._records
+
+    def get(self, ref: int) -> Optional[DeviceRecord]:
+        """Return the record for the given device ref, or None if the device is not registered."""
+        return self._records.get(ref)
+
+    def clear(self) -> None:
+        """Remove all records."""
+        self._records.clear()
+        self._by_platform.clear()
+        self._by_interface.clear()
+        self._by_type.clear()
+
+    def add(self, record: DeviceRecord) -> None:
+        """Add a record, replacing any existing record for the same ref."""
+        self.remove(record.ref)
+        self._records[record.ref] = record
+        if record.platform is not None:
+            self._by_platform.setdefault(record.platform, {})[record.ref] = None
+        self._by_interface.setdefault(record.interface_name, {})[record.ref] = None
+        self._by_type.setdefault(record.device_type_string, {})[record.ref] = None
+
+    def remove(self, ref: int) -> Optional[DeviceRecord]:
+        """Remove and return the record for the given ref, or None if the device is not registered."""
+        record = self._records.pop(ref, None)
+        if record is None:
+            return None
+        if record.platform is not None:
+            self._by_platform[record.platform].pop(ref, None)
+        self._by_interface[record.interface_name].pop(ref, None)
+        self._by_type[record.device_type_string].pop(ref, None)
+        return record
+
+    def interface_names(self) -> list:
+        """Return the names of all interfaces providing at least one registered device."""
+        return [name for name, refs in self._by_interface.items() if refs]
+
+    def refs_for_platform(self, platform: str) -> list:
+        """Return the refs of all devices assigned to the given Home Assistant platform."""
+        return list(self._by_platform.get(platform, ()))
+
+    def refs_for_interface(self, interface_name: str) -> list:
+        """Return the refs of all devices provided by the given interface."""
+        return list(self._by_interface.get(interface_name, ()))
+
+    def refs_for_type(self, device_type_string: Optional[str]) -> list:
+        """Return the refs of all devices with the given device type string."""
+        return list(self._by_type.get(device_type_string, ()))
+
+
+def get_interface_name(
+    device: Union[
+        HomeSeerStatusDevice,
+        HomeSeerSwitchableDevice,
+        HomeSeerDimmableDevice,
+        HomeSeerLockableDevice,
+    ],
+) -> str:
+    """Return the interface name of the device, or the default interface name for devices without one."""
+    if device.interface_name is not None:
+        return device.interface_name
+    return DEFAULT_INTERFACE_NAME
+
+
+def classify_device(
+    device: Union[
+        HomeSeerStatusDevice,
+        HomeSeerSwitchableDevice,
+        HomeSeerDimmableDevice,
+        HomeSeerLockableDevice,
+    ],
+    iname: str,
+    allowed_interfaces: frozenset,
+    forced_covers: frozenset,
+) -> Optional[str]:
+    """
+    Return the correct platform for the given device.
+    This function ensures that a HomeSeer device will only ever be represented in one platform,
+    and filters out devices as required.
+    """
+    # Filter out devices from interfaces not selected during the Config Flow.
+    if iname not in allowed_interfaces:
+        _LOGGER.debug(
+            "Device ref %s is from disabled interface %s, not creating an entity for this device",
+            device.ref,
+            iname,
+        )
+        return None
+
+    # Force certain devices selected during the Config Flow to be covers.
+    if device.ref in forced_covers:
+        _LOGGER.debug(
+            "Device ref %s is forced as a cover, creating a cover entity for this device",
+            device.ref,
+        )
+        return "cover"
+
+    # Some devices should be represented as a Home Assistant platform other than what the HS API data suggests
+    # These devices can be "forced" into other platforms by adding their "device_type_string" to the
+    # homeseer_quirks.py file.
+    platform = HOMESEER_QUIRKS.get(device.device_type_string)
+    if platform is not None:
+        return platform
+    _LOGGER.debug(
+        "No platform quirk found for device type string %s, "
+        "automatically assigning a platform for device ref %s",
+        device.device_type_string,
+        device.ref,
+    )
+
+    # Return the platform for the device based on the libhomeseer device type
+    platform = PLATFORM_FOR_DEVICE_CLASS.get(type(device))
+    if platform is None:
+        _LOGGER.debug(
+            "No valid platform detected for device ref %s (type: %s)",
+            device.ref,
+            type(device),
+        )
+    return platform
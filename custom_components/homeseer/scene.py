@@ -10,26 +10,18 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up HomeSeer events as Home Assistant scenes."""
-    scenes = []
-    bridge = hass.data[DOMAIN]
-
-    for event in bridge.devices["scene"]:
-        entity = HomeSeerScene(event)
-        scenes.append(entity)
-        _LOGGER.info(f"Added HomeSeer event: {entity.name}")
-
-    if scenes:
-        async_add_entities(scenes)
+    bridge = hass.data[DOMAIN][config_entry.entry_id]
+    bridge.async_setup_platform("scene", async_add_entities, HomeSeerScene)
 
 
 class HomeSeerScene(Scene):
     """Representation of a HomeSeer event."""
 
-    def __init__(self, event):
+    __slots__ = ("_event", "_scene_name")
+
+    def __init__(self, event, bridge):
         self._event = event
-        self._group = self._event.group
-        self._name = self._event.name
-        self._scene_name = f"{self._group} {self._name}"
+        self._scene_name = f"{event.group} {event.name}"
 
     @property
     def name(self):
@@ -0,0 +1,152 @@
+"""Coalesces HomeSeer device updates into batched Home Assistant state writes."""
+
+import json
+import logging
+from time import monotonic
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HomeSeerUpdateScheduler:
+    """
+    Collects entities whose HomeSeer device has been updated and writes their state in batches.
+    Updates are flushed once per update window (or on the next event loop iteration for a window of 0);
+    entities with a minimum update interval are deferred until that interval has elapsed so that only
+    their latest value is written.
+    """
+
+    def __init__(self, hass: HomeAssistant, update_window: float = 0) -> None:
+        self._hass = hass
+        self._update_window = update_window
+        self._pending = {}
+        self._deferred = {}
+        self._last_write = {}
+        self._flush_handle = None
+        self._deferred_handle = None
+        self._deferred_due = None
+        self.updates_received = 0
+        self.updates_suppressed = 0
+        self.updates_written = 0
+        self.metrics = None
+        self.profiler = None
+
+    @property
+    def update_window(self) -> float:
+        """Return the number of seconds updates are collected before being written."""
+        return self._update_window
+
+    @update_window.setter
+    def update_window(self, update_window: float) -> None:
+        self._update_window = update_window
+
+    @callback
+    def async_schedule(self, entity, received: bool = True) -> None:
+        """
+        Mark an entity as updated and schedule a flush if one is not already pending.
+        received is False for writes that do not follow a new device update (e.g. of a held value).
+        """
+        if received:
+            self.updates_received += 1
+        self._pending[entity] = None
+        if self._flush_handle is None:
+            if self._update_window > 0:
+                self._flush_handle = self._hass.loop.call_later(
+                    self._update_window, self._async_flush
+                )
+            else:
+                self._flush_handle = self._hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def async_suppress(self) -> None:
+        """Count a device update that was received but suppressed by an update filter without a state write."""
+        self.updates_received += 1
+        self.updates_suppressed += 1
+
+    @callback
+    def async_cancel(self, entity) -> None:
+        """Discard any pending state write for an entity (e.g. when it is removed)."""
+        self._pending.pop(entity, None)
+        self._deferred.pop(entity, None)
+        self._last_write.pop(entity, None)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel all scheduled flushes and drop pending state writes."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._deferred_handle is not None:
+            self._deferred_handle.cancel()
+            self._deferred_handle = None
+        self._pending.clear()
+        self._deferred.clear()
+        self._last_write.clear()
+
+    @callback
+    def _async_flush(self) -> None:
+        """Write the state of all pending entities whose minimum update interval has elapsed."""
+        self._flush_handle = None
+        pending = self._pending
+        self._pending = {}
+        now = monotonic()
+        measure = self.metrics is not None or self.profiler is not None
+
+        for entity in pending:
+            min_interval = entity.min_update_interval
+            if min_interval:
+                due = self._last_write.get(entity, 0) + min_interval
+                if due > now:
+                    self._defer(entity, due)
+                    continue
+                self._last_write[entity] = now
+            self._deferred.pop(entity, None)
+            if measure:
+                self._async_write_measured(entity)
+            else:
+                entity.async_write_ha_state()
+            self.updates_written += 1
+
+    @callback
+    def _async_write_measured(self, entity) -> None:
+        """Write an entity's state, recording its cost for the metrics collector and profiler."""
+        start = monotonic()
+        entity.async_write_ha_state()
+        elapsed = monotonic() - start
+
+        if self.metrics is not None:
+            self.metrics.dispatch_latency.record(elapsed)
+
+        if self.profiler is not None:
+            state = self._hass.states.get(entity.entity_id)
+            attribute_bytes = (
+                len(json.dumps(dict(state.attributes), default=str))
+                if state is not None
+                else 0
+            )
+            self.profiler.record_write(entity.ref, elapsed, attribute_bytes)
+
+    def _defer(self, entity, due: float) -> None:
+        """Hold an entity's state write until its minimum update interval has elapsed."""
+        self._deferred[entity] = None
+        if self._deferred_due is not None and self._deferred_due <= due:
+            return
+        if self._deferred_handle is not None:
+            self._deferred_handle.cancel()
+        self._deferred_due = due
+        self._deferred_handle = self._hass.loop.call_later(
+            due - monotonic(), self._async_release_deferred
+        )
+
+    @callback
+    def _async_release_deferred(self) -> None:
+        """Move deferred entities back into the pending batch and flush them."""
+        self._deferred_handle = None
+        self._deferred_due = None
+        deferred = self._deferred
+        self._deferred = {}
+        self._pending.update(deferred)
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._async_flush()
@@ -1,6 +1,8 @@
 """Support for HomeSeer sensor-type devices."""
 
+from functools import lru_cache
 import logging
+from time import monotonic
 from libhomeseer import (
     DEVICE_ZWAVE_BATTERY,
     DEVICE_ZWAVE_DOOR_LOCK_LOGGING,
@@ -45,7 +47,11 @@ from homeassistant.const import (
     ELECTRIC_POTENTIAL_VOLT,
 )
 
-from .const import DOMAIN
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, ENTITY_CATEGORY_DIAGNOSTIC
 from .homeseer import HomeSeerEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -56,21 +62,95 @@ GENERIC_VALUE_SENSOR_TYPES = [
     DEVICE_ZWAVE_SENSOR_MULTILEVEL,
 ]
 
+# Device types that get_sensor_entity represents with HomeSeerValueSensor or one of its subclasses;
+# update filters only apply to these.
+VALUE_SENSOR_TYPES = frozenset(
+    [DEVICE_ZWAVE_BATTERY, DEVICE_ZWAVE_RELATIVE_HUMIDITY, *GENERIC_VALUE_SENSOR_TYPES]
+)
+
+# Maps a HomeSeer unit of measure to a Home Assistant (unit of measurement, device class) pair.
+HS_UNIT_MAP = {
+    HS_UNIT_A: (ELECTRIC_CURRENT_AMPERE, DEVICE_CLASS_CURRENT),
+    HS_UNIT_AMPERES: (ELECTRIC_CURRENT_AMPERE, DEVICE_CLASS_CURRENT),
+    HS_UNIT_CELSIUS: (TEMP_CELSIUS, DEVICE_CLASS_TEMPERATURE),
+    HS_UNIT_FAHRENHEIT: (TEMP_FAHRENHEIT, DEVICE_CLASS_TEMPERATURE),
+    HS_UNIT_KW: (POWER_KILO_WATT, DEVICE_CLASS_POWER),
+    HS_UNIT_KWH: (ENERGY_KILO_WATT_HOUR, DEVICE_CLASS_ENERGY),
+    HS_UNIT_LUX: (LIGHT_LUX, DEVICE_CLASS_ILLUMINANCE),
+    HS_UNIT_PERCENTAGE: (PERCENTAGE, None),
+    HS_UNIT_V: (ELECTRIC_POTENTIAL_VOLT, DEVICE_CLASS_VOLTAGE),
+    HS_UNIT_VOLTS: (ELECTRIC_POTENTIAL_VOLT, DEVICE_CLASS_VOLTAGE),
+    HS_UNIT_W: (POWER_WATT, DEVICE_CLASS_POWER),
+    HS_UNIT_WATTS: (POWER_WATT, DEVICE_CLASS_POWER),
+}
+
+UNIT_CACHE_SIZE = 256
+
+# Characters making up the numeric part of a status string such as "23.5 C" or "-1,234 W".
+STATUS_VALUE_CHARS = "0123456789.,-+ "
+
+
+def _mean_ms(histogram):
+    """Return the mean of a latency histogram in milliseconds."""
+    if histogram.mean is None:
+        return None
+    return round(histogram.mean * 1000, 1)
+
+
+# Maps a metric key to its (name, unit of measurement, value function); value functions are passed the bridge.
+METRIC_SENSORS = {
+    "updates_received": (
+        "Updates Received",
+        None,
+        lambda bridge: bridge.updates_received,
+    ),
+    "updates_written": (
+        "State Writes",
+        None,
+        lambda bridge: bridge.updates_written,
+    ),
+    "reconnects": (
+        "Reconnects",
+        None,
+        lambda bridge: bridge.reconnects,
+    ),
+    "catalog_load_time": (
+        "Catalog Load Time",
+        "s",
+        lambda bridge: bridge.metrics.catalog_load_time,
+    ),
+    "update_latency": (
+        "Update Latency",
+        "ms",
+        lambda bridge: _mean_ms(bridge.metrics.update_latency),
+    ),
+    "dispatch_latency": (
+        "State Write Latency",
+        "ms",
+        lambda bridge: _mean_ms(bridge.metrics.dispatch_latency),
+    ),
+    "ack_latency": (
+        "Command Acknowledgement Latency",
+        "ms",
+        lambda bridge: _mean_ms(bridge.metrics.ack_latency),
+    ),
+    "command_latency": (
+        "Command Latency",
+        "ms",
+        lambda bridge: _mean_ms(bridge.metrics.command_latency),
+    ),
+}
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up HomeSeer sensor-type devices."""
-    sensor_entities = []
-    bridge = hass.data[DOMAIN]
-
-    for device in bridge.devices["sensor"]:
-        entity = get_sensor_entity(device, bridge)
-        sensor_entities.append(entity)
-        _LOGGER.info(
-            f"Added HomeSeer sensor-type device: {entity.name} ({entity.device_state_attributes})"
-        )
+    bridge = hass.data[DOMAIN][config_entry.entry_id]
+    bridge.async_setup_platform("sensor", async_add_entities, get_sensor_entity)
 
-    if sensor_entities:
-        async_add_entities(sensor_entities)
+    if bridge.metrics is not None:
+        async_add_entities(
+            [HomeSeerMetricSensor(bridge, key) for key in METRIC_SENSORS]
+        )
 
 
 class HomeSeerStatusSensor(HomeSeerEntity):
@@ -84,53 +164,113 @@ class HomeSeerStatusSensor(HomeSeerEntity):
 class HomeSeerValueSensor(HomeSeerEntity):
     """Base representation of a HomeSeer sensor-type device that reports numeric values."""
 
+    __slots__ = (
+        "_status_suffix",
+        "_unit",
+        "_unit_device_class",
+        "_written_value",
+        "_written_available",
+        "_written_time",
+        "_unsub_max_age",
+    )
+
+    def __init__(self, device, bridge):
+        super().__init__(device, bridge)
+        self._status_suffix = None
+        self._unit = None
+        self._unit_device_class = None
+        self._written_value = None
+        self._written_available = None
+        self._written_time = 0
+        self._unsub_max_age = None
+
     @property
     def state(self):
         return self._device.value
 
+    @property
+    def min_update_interval(self) -> float:
+        """Return the minimum number of seconds between state writes for high-frequency sensors."""
+        update_filter = self._bridge.get_update_filter(self._device)
+        if update_filter is not None and update_filter.min_interval:
+            return update_filter.min_interval
+        return self._bridge.sensor_min_interval
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending max-age write."""
+        await super().async_will_remove_from_hass()
+        if self._unsub_max_age is not None:
+            self._unsub_max_age()
+            self._unsub_max_age = None
+
+    @callback
+    def _update_callback(self) -> None:
+        """Schedule a state write unless the device's update filter suppresses the new value."""
+        update_filter = self._bridge.get_update_filter(self._device)
+        if update_filter is None or not self._suppressed(update_filter):
+            self._async_accept_update()
+            return
+
+        self._bridge.scheduler.async_suppress()
+        if update_filter.max_age and self._unsub_max_age is None:
+            self._unsub_max_age = async_call_later(
+                self.hass,
+                max(0, self._written_time + update_filter.max_age - monotonic()),
+                self._async_max_age_expired,
+            )
+
+    def _suppressed(self, update_filter) -> bool:
+        """Return True if the current value falls within the filter's deadband of the last written value."""
+        if self._written_value is None or self.available != self._written_available:
+            return False
+        if (
+            update_filter.max_age
+            and monotonic() - self._written_time >= update_filter.max_age
+        ):
+            return False
+        return update_filter.suppresses(self._written_value, self._device.value)
+
+    @callback
+    def _async_accept_update(self, received: bool = True) -> None:
+        """
+        Remember the value being written and schedule the state write.
+        received is False when writing a held value rather than a new device update.
+        """
+        if self._unsub_max_age is not None:
+            self._unsub_max_age()
+            self._unsub_max_age = None
+        self._written_value = self._device.value
+        self._written_available = self.available
+        self._written_time = monotonic()
+        if received:
+            super()._update_callback()
+        else:
+            self._bridge.scheduler.async_schedule(self, received=False)
+
+    @callback
+    def _async_max_age_expired(self, *args) -> None:
+        """Write the latest suppressed value once the filter's max age has passed."""
+        self._unsub_max_age = None
+        self._async_accept_update(received=False)
+
     @property
     def unit_of_measurement(self):
         """Return the unit of measurement parsed from the device's status."""
-        unit = get_uom_from_status(self._device.status)
-        if unit == HS_UNIT_LUX:
-            return LIGHT_LUX
-        elif unit == HS_UNIT_CELSIUS:
-            return TEMP_CELSIUS
-        elif unit == HS_UNIT_FAHRENHEIT:
-            return TEMP_FAHRENHEIT
-        elif unit == HS_UNIT_PERCENTAGE:
-            return PERCENTAGE
-        elif unit == HS_UNIT_A or unit == HS_UNIT_AMPERES:
-            return ELECTRIC_CURRENT_AMPERE
-        elif unit == HS_UNIT_KW:
-            return POWER_KILO_WATT
-        elif unit == HS_UNIT_KWH:
-            return ENERGY_KILO_WATT_HOUR
-        elif unit == HS_UNIT_V or unit == HS_UNIT_VOLTS:
-            return ELECTRIC_POTENTIAL_VOLT
-        elif unit == HS_UNIT_W or unit == HS_UNIT_WATTS:
-            return POWER_WATT
-        return None
+        self._update_unit()
+        return self._unit
 
     @property
     def device_class(self):
         """Return the device class of the device based on the device's unit of measure."""
-        unit = get_uom_from_status(self._device.status)
-        if unit == HS_UNIT_LUX:
-            return DEVICE_CLASS_ILLUMINANCE
-        elif unit == HS_UNIT_CELSIUS or unit == HS_UNIT_FAHRENHEIT:
-            return DEVICE_CLASS_TEMPERATURE
-        elif unit == HS_UNIT_A or unit == HS_UNIT_AMPERES:
-            return DEVICE_CLASS_CURRENT
-        elif unit == HS_UNIT_KW:
-            return DEVICE_CLASS_POWER
-        elif unit == HS_UNIT_KWH:
-            return DEVICE_CLASS_ENERGY
-        elif unit == HS_UNIT_V or unit == HS_UNIT_VOLTS:
-            return DEVICE_CLASS_VOLTAGE
-        elif unit == HS_UNIT_W or unit == HS_UNIT_WATTS:
-            return DEVICE_CLASS_POWER
-        return None
+        self._update_unit()
+        return self._unit_device_class
+
+    def _update_unit(self) -> None:
+        """Resolve the unit of measurement and device class again only if the status suffix has changed."""
+        suffix = self._device.status.lstrip(STATUS_VALUE_CHARS)
+        if suffix != self._status_suffix:
+            self._status_suffix = suffix
+            self._unit, self._unit_device_class = resolve_unit(suffix)
 
 
 class HomeSeerBatterySensor(HomeSeerValueSensor):
@@ -206,6 +346,41 @@ class HomeSeerDoorLockLoggingSensor(HomeSeerStatusSensor):
         return "mdi:lock-clock"
 
 
+class HomeSeerMetricSensor(Entity):
+    """Diagnostic sensor reporting a metric collected by a HomeSeer bridge (polled)."""
+
+    def __init__(self, bridge, key):
+        self._bridge = bridge
+        self._key = key
+        self._name, self._unit, self._value = METRIC_SENSORS[key]
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._bridge.namespace}-metrics-{self._key}"
+
+    @property
+    def name(self) -> str:
+        return f"HomeSeer {self._bridge.namespace} {self._name}"
+
+    @property
+    def state(self):
+        if self._bridge.metrics is None:
+            return None
+        return self._value(self._bridge)
+
+    @property
+    def unit_of_measurement(self):
+        return self._unit
+
+    @property
+    def entity_category(self) -> str:
+        return ENTITY_CATEGORY_DIAGNOSTIC
+
+    @property
+    def device_info(self) -> dict:
+        return self._bridge.hub_device_info
+
+
 def get_sensor_entity(device, connection):
     """Return the proper sensor object based on device type."""
     if device.device_type_string == DEVICE_ZWAVE_BATTERY:
@@ -221,3 +396,9 @@ def get_sensor_entity(device, connection):
     elif device.device_type_string in GENERIC_VALUE_SENSOR_TYPES:
         return HomeSeerValueSensor(device, connection)
     return HomeSeerStatusSensor(device, connection)
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def resolve_unit(status_suffix):
+    """Return the (unit of measurement, device class) pair for the non-numeric part of a device's status."""
+    return HS_UNIT_MAP.get(get_uom_from_status(status_suffix), (None, None))
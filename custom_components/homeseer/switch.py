@@ -12,18 +12,8 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up HomeSeer switch-type devices."""
-    switch_entities = []
-    bridge = hass.data[DOMAIN]
-
-    for device in bridge.devices["switch"]:
-        entity = HomeSeerSwitch(device, bridge)
-        switch_entities.append(entity)
-        _LOGGER.info(
-            f"Added HomeSeer switch-type device: {entity.name} ({entity.device_state_attributes})"
-        )
-
-    if switch_entities:
-        async_add_entities(switch_entities)
+    bridge = hass.data[DOMAIN][config_entry.entry_id]
+    bridge.async_setup_platform("switch", async_add_entities, HomeSeerSwitch)
 
 
 class HomeSeerSwitch(HomeSeerEntity, SwitchEntity):
@@ -32,10 +22,10 @@ class HomeSeerSwitch(HomeSeerEntity, SwitchEntity):
     @property
     def is_on(self):
         """Return true if device is on."""
-        return self._device.is_on
+        return self._assumed("is_on", self._device.is_on)
 
     async def async_turn_on(self, **kwargs):
-        await self._device.on()
+        await self._async_command(self._device.on, is_on=True)
 
     async def async_turn_off(self, **kwargs):
-        await self._device.off()
+        await self._async_command(self._device.off, is_on=False)